@@ -1,11 +1,20 @@
 """FastAPI REST service for Translate2LLM."""
+import time
+import asyncio
 import logging
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional
 from translate2llm import TranslateLLM
-from translate2llm.services.exceptions import TranslationError, LLMError
+from translate2llm.capture import TrafficRecorder
+from translate2llm.metrics import metrics
+from translate2llm.profiling import profiler
+from translate2llm.services.deadline import Deadline
+from translate2llm.services.exceptions import (TranslationError, LLMError, ConfigurationError,
+                                               RequestCancelledError, DeadlineExceededError)
 
 # Configure logging
 logging.basicConfig(
@@ -33,24 +42,67 @@ app.add_middleware(
 # Initialize service
 service = TranslateLLM()
 
+# Optionally record traffic for replay
+capture_config = service.config.get_capture_config()
+recorder = (TrafficRecorder(capture_config["path"],
+                            anonymize=capture_config["anonymize"],
+                            max_bytes=capture_config["max_bytes"],
+                            backup_count=capture_config["backup_count"],
+                            background=service.logging_config["background"])
+            if capture_config["enabled"] else None)
+
+# Seconds between checks for client disconnects while a request is processed
+DISCONNECT_POLL_INTERVAL = 0.1
+
 
 class TranslateRequest(BaseModel):
     """Request model for translation and LLM processing."""
     text: str = Field(..., description="Text to translate and process")
-    target_lang: str = Field(default="en", description="Target language code (e.g., 'en', 'es', 'fr')")
+    target_lang: Optional[str] = Field(
+        default=None,
+        description="Target language code (e.g., 'en', 'es', 'fr'); defaults to the profile's"
+    )
     system_prompt: Optional[str] = Field(
         default="You are a helpful assistant.",
         description="System prompt for the LLM"
     )
+    profile: Optional[str] = Field(
+        default=None,
+        description="Configuration profile from config.ini (e.g., 'fast' for [profile.fast])"
+    )
+    model: Optional[str] = Field(default=None, description="LLM model overriding the profile's model")
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds before the request is abandoned (overrides the X-Request-Timeout header)"
+    )
+    return_in_source_language: bool = Field(
+        default=False,
+        description="Also return the LLM response translated back into the detected source language"
+    )
 
 
 class TranslateResponse(BaseModel):
     """Response model for translation and LLM processing."""
     original_text: str
-    detected_language: str
+    detected_language: Optional[str]
     translated_text: str
     llm_response: str
     target_language: str
+    translated_response: Optional[str] = None
+
+
+@app.on_event("shutdown")
+async def close_recorder():
+    """Flush the traffic recorder."""
+    if recorder is not None:
+        recorder.close()
+
+
+@app.on_event("shutdown")
+async def close_services():
+    """Release pooled services and their background threads."""
+    service.close()
 
 
 @app.get("/")
@@ -69,13 +121,95 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Metrics endpoint."""
+    return {
+        "counters": metrics.snapshot(),
+        "services": service.registry.stats(),
+        "semantic_cache": service.semantic_cache.stats() if service.semantic_cache else None
+    }
+
+
+def _require_profiling_endpoints() -> None:
+    """Hide the profiling endpoints unless ``[profiling] endpoints`` is enabled."""
+    if not service.profiling_config["endpoints"]:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@app.get("/debug/profile", response_class=PlainTextResponse,
+         dependencies=[Depends(_require_profiling_endpoints)])
+async def profile(seconds: float = Query(default=5.0, gt=0)):
+    """
+    Sample every thread for a window and return collapsed stacks.
+
+    The output can be rendered with flamegraph.pl or speedscope.
+    """
+    max_window = service.profiling_config["max_window"]
+    if seconds > max_window:
+        raise HTTPException(status_code=400, detail=f"seconds must not exceed {max_window}")
+    stacks = profiler.start_window()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        output = profiler.stop_window(stacks)
+    return output
+
+
+@app.get("/debug/profile/requests", response_class=PlainTextResponse,
+         dependencies=[Depends(_require_profiling_endpoints)])
+async def request_profile(reset: bool = False):
+    """Return collapsed stacks collected from sampled requests."""
+    return profiler.request_profile(reset=reset)
+
+
+@app.put("/debug/profile/sampling", dependencies=[Depends(_require_profiling_endpoints)])
+async def set_profile_sampling(rate: float = Query(..., ge=0, le=1)):
+    """Set the fraction of requests to profile (0 disables request sampling)."""
+    profiler.configure(sample_rate=rate)
+    return {"sample_rate": profiler.sample_rate, "sampled_requests": profiler.sampled_requests}
+
+
+def _consume_exception(task: asyncio.Future) -> None:
+    """Retrieve the result of an abandoned task so its error is not reported as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def _wait_for_result(task: asyncio.Future, deadline: Deadline, http_request: Request):
+    """
+    Wait for ``task`` while watching for the deadline and client disconnects.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes first
+        RequestCancelledError: If the client disconnects first
+    """
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+        if done:
+            return task.result()
+        if deadline.expired():
+            deadline.cancel("deadline")
+        elif await http_request.is_disconnected():
+            deadline.cancel("client_disconnected")
+        if deadline.cancelled:
+            # The worker stops at its next check; do not hold the response for it
+            task.add_done_callback(_consume_exception)
+            if deadline.reason == "deadline":
+                raise DeadlineExceededError("Deadline exceeded before response")
+            raise RequestCancelledError(f"Request cancelled before response: {deadline.reason}")
+
+
 @app.post("/translate", response_model=TranslateResponse)
-async def translate(request: TranslateRequest):
+async def translate(request: TranslateRequest, http_request: Request,
+                    x_request_timeout: Optional[float] = Header(default=None, gt=0)):
     """
     Translate text and process through LLM.
     
     Args:
         request: Translation request with text, target language, and system prompt
+        http_request: Incoming HTTP request, watched for client disconnects
+        x_request_timeout: Optional request timeout in seconds
         
     Returns:
         Translation and LLM processing results
@@ -83,14 +217,70 @@ async def translate(request: TranslateRequest):
     Raises:
         HTTPException: If translation or LLM processing fails
     """
+    arrival = time.time()
+    started = time.perf_counter()
+    status = 200
+    result = None
     try:
-        result = service.process(
+        result = await _process_request(request, http_request,
+                                        request.timeout or x_request_timeout)
+        return TranslateResponse(**result)
+
+    except HTTPException as e:
+        status = e.status_code
+        raise
+
+    except asyncio.CancelledError:
+        status = 499
+        raise
+
+    except BaseException:
+        status = 500
+        raise
+
+    finally:
+        if recorder is not None:
+            recorder.record(arrival, request.text, request.target_lang, request.system_prompt,
+                            status, time.perf_counter() - started, result,
+                            profile=request.profile, model=request.model,
+                            timeout=request.timeout or x_request_timeout,
+                            return_in_source_language=request.return_in_source_language or None)
+
+
+async def _process_request(request: TranslateRequest, http_request: Request,
+                           timeout: Optional[float]) -> Dict:
+    """
+    Run ``TranslateLLM.process`` in the threadpool under the request's deadline.
+
+    Raises:
+        HTTPException: If translation or LLM processing fails
+    """
+    deadline = Deadline(timeout or service.deadline_config["default_timeout"])
+
+    try:
+        task = asyncio.ensure_future(run_in_threadpool(
+            service.process,
             text=request.text,
             target_lang=request.target_lang,
-            system_prompt=request.system_prompt
-        )
+            system_prompt=request.system_prompt,
+            profile=request.profile,
+            model=request.model,
+            deadline=deadline,
+            return_in_source_language=request.return_in_source_language
+        ))
+        return await _wait_for_result(task, deadline, http_request)
         
-        return TranslateResponse(**result)
+    except DeadlineExceededError as e:
+        logger.warning(f"Deadline exceeded: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
+        
+    except RequestCancelledError as e:
+        logger.warning(f"Request cancelled: {str(e)}")
+        raise HTTPException(status_code=499, detail=str(e))
+        
+    except ConfigurationError as e:
+        logger.error(f"Configuration error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
         
     except TranslationError as e:
         logger.error(f"Translation error: {str(e)}")
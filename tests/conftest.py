@@ -1,15 +1,15 @@
 import os
 import sys
 
-# Ensure project root is on sys.path so `import src` works when running tests
+# Ensure project root is on sys.path so `import translate2llm` works when running tests
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 import pytest
 from unittest.mock import Mock, patch
-from src.services.llm_service import LLMService
-from src.services.translation_service import TranslationService
+from translate2llm.services.llm_service import LLMService
+from translate2llm.services.translation_service import TranslationService
 
 @pytest.fixture
 def llm_config():
@@ -33,10 +33,10 @@ def mock_chat_model():
 @pytest.fixture
 def llm_service(llm_config, mock_chat_model):
     """LLMService fixture with mock model."""
-    with patch("src.services.llm_service.init_chat_model", return_value=mock_chat_model):
+    with patch("translate2llm.services.llm_service.init_chat_model", return_value=mock_chat_model):
         return LLMService(llm_config)
 
-from src.services.translation_service import TranslationService
+from translate2llm.services.translation_service import TranslationService
 
 @pytest.fixture
 def translation_config():
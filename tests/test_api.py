@@ -0,0 +1,146 @@
+"""API tests for deadline and cancellation status codes."""
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import Request
+from fastapi.testclient import TestClient
+import api
+from translate2llm import TranslateLLM
+
+
+@pytest.fixture
+def blocked_llm(monkeypatch):
+    """Detect English input and hold the LLM stream until the test finishes."""
+    release = threading.Event()
+
+    def stream(messages, **kwargs):
+        release.wait(5)
+        yield Mock(content="late answer")
+
+    translator = Mock()
+    translator.detect.return_value = Mock(lang="en")
+    monkeypatch.setattr(api.service.translation_service, "translator", translator)
+    monkeypatch.setattr(api.service.llm_service, "llm", Mock(stream=stream))
+    yield
+    release.set()
+
+
+@pytest.fixture
+def client():
+    """TestClient for the API app."""
+    return TestClient(api.app)
+
+
+class TestTranslateDeadlines:
+    """Test cases for deadline and disconnect handling in /translate."""
+
+    def test_deadline_returns_504(self, client, blocked_llm):
+        """Test a deadline passing mid-flight is reported as a gateway timeout."""
+        response = client.post("/translate", json={"text": "Hello there"},
+                               headers={"X-Request-Timeout": "0.6"})
+        assert response.status_code == 504
+
+    def test_disconnect_returns_499(self, client, blocked_llm, monkeypatch):
+        """Test a client disconnect is reported as a cancelled request."""
+        monkeypatch.setattr(Request, "is_disconnected", AsyncMock(return_value=True))
+        response = client.post("/translate", json={"text": "Hello there", "timeout": 5})
+        assert response.status_code == 499
+
+    @pytest.mark.parametrize("timeout", ["0", "-1"])
+    def test_timeout_header_validated(self, client, timeout):
+        """Test non-positive timeout headers are rejected like the body field."""
+        response = client.post("/translate", json={"text": "Hello there"},
+                               headers={"X-Request-Timeout": timeout})
+        assert response.status_code == 422
+
+
+@pytest.fixture
+def profile_service(tmp_path, monkeypatch):
+    """Serve the API from a config with a Spanish profile backed by stand-in services."""
+    path = tmp_path / "config.ini"
+    path.write_text("[llm]\nmodel = mistral\n\n[translation]\ntarget_lang = en\n\n"
+                    "[profile.es]\ntarget_lang = es\n")
+
+    def translation_service(config):
+        return Mock(config=config, target_lang=config["target_lang"],
+                    detect_language=Mock(return_value="fr"),
+                    translate=lambda text, target_lang=None, source_lang=None:
+                        f"[{target_lang or config['target_lang']}] {text}")
+
+    with patch("translate2llm.services.service_registry.TranslationService",
+               side_effect=translation_service), \
+         patch("translate2llm.services.service_registry.LLMService",
+               side_effect=lambda config: Mock(config=config,
+                                               process_text=Mock(return_value="ok"))):
+        service = TranslateLLM(str(path))
+    monkeypatch.setattr(api, "service", service)
+    monkeypatch.setattr(service.llm_service, "llm",
+                        Mock(stream=lambda messages, **kwargs: iter([Mock(content="ok")])))
+    yield service
+    service.close()
+
+
+class TestTranslateProfiles:
+    """Test cases for profile selection in /translate."""
+
+    def test_profile_target_lang(self, client, profile_service):
+        """Test a profile's target language applies when the request omits one."""
+        response = client.post("/translate", json={"text": "bonjour", "profile": "es"})
+        assert response.status_code == 200
+        assert response.json()["target_language"] == "es"
+        assert response.json()["translated_text"] == "[es] bonjour"
+
+    def test_request_target_lang_overrides_profile(self, client, profile_service):
+        """Test an explicit target language wins over the profile's."""
+        response = client.post("/translate", json={"text": "bonjour", "profile": "es",
+                                                   "target_lang": "de"})
+        assert response.json()["target_language"] == "de"
+
+    def test_empty_text_uses_profile_target_lang(self, client, profile_service):
+        """Test the empty-text response reports the profile's target language."""
+        response = client.post("/translate", json={"text": " ", "profile": "es"})
+        assert response.json()["target_language"] == "es"
+
+
+class TestTranslateModels:
+    """Test cases for model selection in /translate."""
+
+    def test_unlisted_model_rejected(self, client):
+        """Test a model outside the allowlist is rejected before any service is built."""
+        stats = api.service.registry.stats()
+        response = client.post("/translate", json={"text": "Hello there", "model": "unlisted"})
+        assert response.status_code == 400
+        assert api.service.registry.stats() == stats
+
+
+class TestProfilingEndpoints:
+    """Test cases for the /debug/profile endpoints switch."""
+
+    @pytest.mark.parametrize("method, path", [
+        ("get", "/debug/profile?seconds=0.01"),
+        ("get", "/debug/profile/requests"),
+        ("put", "/debug/profile/sampling?rate=0"),
+    ])
+    def test_disabled_by_default(self, client, method, path):
+        """Test the profiling endpoints are hidden unless enabled."""
+        assert getattr(client, method)(path).status_code == 404
+
+    def test_enabled(self, client, monkeypatch):
+        """Test the profiling endpoints respond once enabled."""
+        monkeypatch.setitem(api.service.profiling_config, "endpoints", True)
+        response = client.get("/debug/profile", params={"seconds": 0.01})
+        assert response.status_code == 200
+
+
+class TestTrafficCapture:
+    """Test cases for the status recorded for captured requests."""
+
+    def test_failed_response_recorded_as_500(self, monkeypatch):
+        """Test a response that fails validation is not recorded as a success."""
+        recorder = Mock()
+        monkeypatch.setattr(api, "recorder", recorder)
+        monkeypatch.setattr(api.service, "process", lambda **kwargs: {"timings": {}})
+        response = TestClient(api.app, raise_server_exceptions=False).post(
+            "/translate", json={"text": "Hello there"})
+        assert response.status_code == 500
+        assert recorder.record.call_args.args[4] == 500
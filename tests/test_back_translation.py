@@ -0,0 +1,91 @@
+"""Unit tests for streaming back-translation."""
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from translate2llm.services.back_translation import BackTranslator, SentenceBuffer
+from translate2llm.services.exceptions import LLMError, TranslationError
+
+
+@pytest.fixture
+def executor():
+    """Executor fixture for sentence translations."""
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestSentenceBuffer:
+    """Test cases for SentenceBuffer."""
+
+    def test_split_across_chunks(self):
+        """Test sentences are emitted once their boundary is seen."""
+        buffer = SentenceBuffer()
+        assert buffer.feed("Hello there. How") == [("Hello there.", " ")]
+        assert buffer.feed(" are you?") == []
+        assert buffer.feed(" Fine") == [("How are you?", " ")]
+        assert buffer.flush() == [("Fine", "")]
+
+    def test_decimal_not_split(self):
+        """Test a period inside a number is not a boundary."""
+        buffer = SentenceBuffer()
+        assert buffer.feed("Pi is 3.14 today. ") == []
+        assert buffer.feed("Yes") == [("Pi is 3.14 today.", " ")]
+
+    def test_abbreviations_not_split(self):
+        """Test titles and initials do not end a sentence."""
+        buffer = SentenceBuffer()
+        assert buffer.feed("This is Dr. Smith. Ask J. R. Tolkien, e.g. today. Bye") == [
+            ("This is Dr. Smith.", " "), ("Ask J. R. Tolkien, e.g. today.", " ")
+        ]
+        assert buffer.feed(". Mr. Brown left. ") == []
+        assert buffer.flush() == [("Bye. Mr. Brown left. ", "")]
+
+    def test_cjk_and_newlines(self):
+        """Test CJK full stops and line breaks end sentences."""
+        buffer = SentenceBuffer()
+        assert buffer.feed("今日は。元気？") == [("今日は。", ""), ("元気？", "")]
+        assert buffer.feed("One\nTwo") == [("One", "\n")]
+
+
+class TestBackTranslator:
+    """Test cases for BackTranslator."""
+
+    def test_translates_in_order(self, executor):
+        """Test sentences are translated concurrently and rejoined in order."""
+        service = Mock()
+
+        def translate(text, target_lang, source_lang):
+            time.sleep(0.05 if text.startswith("First") else 0)
+            return f"<{target_lang}>{text}"
+
+        service.translate.side_effect = translate
+        back_translator = BackTranslator(service, executor, source_lang="en", target_lang="es")
+        for chunk in ["First one. Sec", "ond one.\n", "Third"]:
+            back_translator.feed(chunk)
+        assert back_translator.result() == "<es>First one. <es>Second one.\n<es>Third"
+        service.translate.assert_any_call("Third", target_lang="es", source_lang="en")
+
+    def test_translation_error(self, executor):
+        """Test sentence translation errors propagate."""
+        service = Mock()
+        service.translate.side_effect = TranslationError("failed")
+        back_translator = BackTranslator(service, executor, source_lang="en", target_lang="es")
+        back_translator.feed("Hello.")
+        with pytest.raises(TranslationError):
+            back_translator.result()
+
+
+class TestLLMStreaming:
+    """Test cases for LLMService.stream_text."""
+
+    def test_stream_text(self, llm_service):
+        """Test response chunks are yielded as they arrive."""
+        llm_service.llm.stream = Mock(return_value=iter([Mock(content="Hi"), Mock(content="!")]))
+        assert list(llm_service.stream_text("Hello", "Be helpful")) == ["Hi", "!"]
+
+    def test_stream_text_error(self, llm_service):
+        """Test streaming errors are raised as LLMError."""
+        llm_service.llm.stream = Mock(side_effect=Exception("Connection failed"))
+        with pytest.raises(LLMError):
+            list(llm_service.stream_text("Hello"))
@@ -0,0 +1,87 @@
+"""Unit tests for request deadlines and cancellation."""
+import time
+import concurrent.futures
+import pytest
+from unittest.mock import Mock
+from translate2llm.services.deadline import Deadline, current_deadline, deadline_scope
+from translate2llm.services.exceptions import DeadlineExceededError, RequestCancelledError
+
+
+class TestDeadline:
+    """Test cases for Deadline."""
+
+    def test_unbounded(self):
+        """Test a deadline without timeout never expires."""
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert deadline.expired() is False
+        deadline.check("llm", 10.0)
+
+    def test_check_min_budget(self):
+        """Test a stage is skipped when the remaining budget is too small."""
+        deadline = Deadline(0.5)
+        deadline.check("detection", 0.1)
+        with pytest.raises(DeadlineExceededError):
+            deadline.check("llm", 1.0)
+
+    def test_check_cancelled(self):
+        """Test a cancelled deadline stops the next stage."""
+        deadline = Deadline(10)
+        deadline.cancel("client_disconnected")
+        assert deadline.reason == "client_disconnected"
+        with pytest.raises(RequestCancelledError):
+            deadline.check("translation")
+
+    def test_check_cancelled_by_deadline(self):
+        """Test a request cancelled because its deadline passed reports the deadline."""
+        deadline = Deadline(10)
+        deadline.cancel("deadline")
+        with pytest.raises(DeadlineExceededError):
+            deadline.check("response")
+
+    def test_wait_times_out(self):
+        """Test waiting on a future is abandoned when the deadline passes."""
+        deadline = Deadline(0.1)
+        future = concurrent.futures.Future()
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            deadline.wait(future)
+        assert time.monotonic() - start < 1.0
+        assert future.cancelled()
+
+    def test_wait_result(self):
+        """Test waiting returns the future's result."""
+        future = concurrent.futures.Future()
+        future.set_result("done")
+        assert Deadline(1).wait(future) == "done"
+
+    def test_deadline_scope(self):
+        """Test the scope sets and restores the current deadline."""
+        deadline = Deadline(1)
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+        assert current_deadline() is None
+
+
+class TestLLMDeadline:
+    """Test cases for deadline handling in LLMService."""
+
+    def test_stream_stops_when_cancelled(self, llm_service):
+        """Test generation stops once the request is cancelled."""
+        deadline = Deadline(10)
+
+        def chunks():
+            yield Mock(content="Hello")
+            deadline.cancel("client_disconnected")
+            yield Mock(content=" world")
+            yield Mock(content="!")
+
+        llm_service.llm.stream = Mock(return_value=chunks())
+        with deadline_scope(deadline), pytest.raises(RequestCancelledError):
+            llm_service.process_text("Hi")
+
+    def test_stream_with_deadline(self, llm_service):
+        """Test the streamed response is joined when within the deadline."""
+        llm_service.llm.stream = Mock(return_value=iter([Mock(content="Hel"), Mock(content="lo")]))
+        with deadline_scope(Deadline(10)):
+            assert llm_service.process_text("Hi") == "Hello"
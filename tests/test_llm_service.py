@@ -2,7 +2,7 @@
 
 
 import pytest
-from src.services.exceptions import LLMError
+from translate2llm.services.exceptions import LLMError
 
 from unittest.mock import Mock, patch
 from langchain.chat_models.base import init_chat_model
@@ -13,9 +13,9 @@ class TestLLMService:
 
     def test_init_chat_model_success(self, llm_config):
         """Test successful chat model initialization."""
-        with patch('src.services.llm_service.init_chat_model') as mock_init:
+        with patch('translate2llm.services.llm_service.init_chat_model') as mock_init:
             mock_init.return_value = Mock()
-            from src.services.llm_service import LLMService
+            from translate2llm.services.llm_service import LLMService
             service = LLMService(llm_config)
             assert service.llm is not None
             mock_init.assert_called_once()
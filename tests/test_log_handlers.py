@@ -0,0 +1,77 @@
+"""Unit tests for the logging handlers and setup."""
+import logging
+from logging.handlers import QueueHandler
+from queue import Queue
+import pytest
+from translate2llm.capture import TrafficRecorder
+from translate2llm.config.config_manager import Config
+from translate2llm.config.log_handlers import DeferredQueueHandler, SamplingFilter
+
+
+def _record(level, msg="value %s", args=("x",)):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def root_handlers():
+    """Restore the root logger's handlers after a test."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    yield root
+    for handler in root.handlers:
+        if isinstance(handler, QueueHandler):
+            handler.close()
+    root.handlers = handlers
+
+
+class TestLogHandlers:
+    """Test cases for logging handlers."""
+
+    def test_sampling_filter_drops_info(self):
+        """Test INFO records are dropped at a zero sample rate."""
+        sampling = SamplingFilter(0.0)
+        assert sampling.filter(_record(logging.INFO)) is False
+        assert sampling.filter(_record(logging.DEBUG)) is False
+
+    def test_sampling_filter_keeps_warnings(self):
+        """Test WARNING and above always pass."""
+        sampling = SamplingFilter(0.0)
+        assert sampling.filter(_record(logging.WARNING)) is True
+        assert sampling.filter(_record(logging.ERROR)) is True
+
+    def test_deferred_queue_handler_does_not_format(self):
+        """Test records are queued without formatting the message."""
+        queue = Queue()
+        record = _record(logging.INFO)
+        DeferredQueueHandler(queue).handle(record)
+        queued = queue.get_nowait()
+        assert queued.msg == "value %s"
+        assert queued.args == ("x",)
+
+    def test_setup_background_logging(self, tmp_path, root_handlers):
+        """Test background mode moves root handlers behind a queue."""
+        path = tmp_path / "config.ini"
+        path.write_text("[logging]\nbackground = true\nsample_rate = 0.5\n")
+        Config(str(path)).setup_logging()
+        Config(str(path)).setup_logging()
+        assert len(root_handlers.handlers) == 1
+        handler = root_handlers.handlers[0]
+        assert isinstance(handler, DeferredQueueHandler)
+        assert len([f for f in handler.filters if isinstance(f, SamplingFilter)]) == 1
+
+    def test_recorder_shares_background_queue(self, tmp_path, root_handlers):
+        """Test the traffic recorder writes through the logging listener, not the root handlers."""
+        seen = []
+        probe = logging.Handler()
+        probe.emit = seen.append
+        root_handlers.handlers = [probe]
+        path = tmp_path / "config.ini"
+        path.write_text("[logging]\nbackground = true\n")
+        Config(str(path)).setup_logging()
+
+        recorder = TrafficRecorder(str(tmp_path / "capture.jsonl"), background=True)
+        recorder.record(1.0, "Hola", "en", None, 200, 0.1)
+        recorder.close()
+        assert recorder._listener is None
+        assert '"status": 200' in (tmp_path / "capture.jsonl").read_text(encoding="utf-8")
+        assert not [record for record in seen if record.name == recorder._logger.name]
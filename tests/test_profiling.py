@@ -0,0 +1,49 @@
+"""Unit tests for the sampling profiler."""
+import time
+import pytest
+from translate2llm.profiling import Profiler, _NULL_SCOPE
+
+
+def _busy(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+class TestProfiler:
+    """Test cases for Profiler."""
+
+    def test_disabled_scope_is_noop(self):
+        """Test unsampled requests get a shared no-op scope."""
+        profiler = Profiler(sample_rate=0.0)
+        assert profiler.request_scope() is _NULL_SCOPE
+        assert profiler._thread is None
+
+    def test_sampled_request(self):
+        """Test a sampled request's stacks are collected."""
+        profiler = Profiler(sample_rate=1.0, interval=0.001)
+        with profiler.request_scope():
+            _busy(0.1)
+        output = profiler.request_profile(reset=True)
+        assert "_busy" in output
+        assert profiler.request_profile() == ""
+
+    def test_profile_window(self):
+        """Test a profiling window returns collapsed stack lines."""
+        profiler = Profiler(interval=0.001)
+        output = profiler.profile(0.05)
+        lines = [line.rsplit(" ", 1) for line in output.splitlines()]
+        assert any("profile (" in stack for stack, _ in lines)
+        assert all(int(count) > 0 for _, count in lines)
+
+    def test_sampler_stops_when_idle(self):
+        """Test the sampler thread exits once nothing is profiled."""
+        profiler = Profiler(interval=0.001)
+        profiler.profile(0.01)
+        time.sleep(0.05)
+        assert profiler._thread is None
+
+    def test_configure_invalid_rate(self):
+        """Test invalid sample rates are rejected."""
+        with pytest.raises(ValueError):
+            Profiler().configure(sample_rate=2.0)
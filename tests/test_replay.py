@@ -0,0 +1,132 @@
+"""Unit tests for traffic capture and replay."""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from translate2llm.capture import TrafficRecorder
+from translate2llm.replay import (load_capture, replay_text, replay, build_report,
+                                  HTTPSender, InProcessSender)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """TrafficRecorder fixture writing to a temporary file."""
+    recorder = TrafficRecorder(str(tmp_path / "capture.jsonl"))
+    yield recorder
+    recorder.close()
+
+
+class TestTrafficRecorder:
+    """Test cases for TrafficRecorder."""
+
+    def test_record_anonymized(self, recorder):
+        """Test anonymized records keep the text length and hash only."""
+        result = {"detected_language": "es", "timings": {"llm": 0.5}}
+        recorder.record(100.0, "¡Hola!", "en", "Be helpful", 200, 0.7, result, model="phi3")
+        record = json.loads(open(recorder.path, encoding="utf-8").readline())
+        assert "text" not in record
+        assert record["text_length"] == 6
+        assert record["source_lang"] == "es"
+        assert record["timings"] == {"llm": 0.5}
+        assert record["model"] == "phi3"
+        assert "profile" not in record
+
+    def test_record_raw_text(self, tmp_path):
+        """Test the text is kept when anonymization is disabled."""
+        recorder = TrafficRecorder(str(tmp_path / "raw.jsonl"), anonymize=False)
+        record = recorder.build_record(100.0, "Hola", "en", None, 504, 5.0)
+        recorder.close()
+        assert record["text"] == "Hola"
+        assert record["status"] == 504
+
+
+class TestReplay:
+    """Test cases for replaying captures."""
+
+    def test_load_capture_sorted(self, recorder):
+        """Test records are loaded in arrival order."""
+        recorder.record(2.0, "b", "en", None, 200, 0.1)
+        recorder.record(1.0, "a", "en", None, 200, 0.1)
+        assert [r["arrival"] for r in load_capture(recorder.path)] == [1.0, 2.0]
+
+    def test_replay_text_length(self):
+        """Test anonymized texts are rebuilt at the recorded length and are unique."""
+        record = {"text_length": 40}
+        assert len(replay_text(record, 3)) == 40
+        assert replay_text(record, 3) != replay_text(record, 4)
+
+    def test_replay_scaled_rate(self):
+        """Test records are issued at the scaled rate and summarized."""
+        records = [{"arrival": 0.0, "latency": 0.2, "status": 200},
+                   {"arrival": 0.2, "latency": 0.2, "status": 200}]
+        sent = []
+        results = replay(records, lambda record, text: sent.append(text) or 500, speed=2.0)
+        report = build_report(results)
+        assert len(sent) == 2
+        assert report["requests"] == 2
+        assert report["status_mismatches"] == 2
+        assert report["statuses"] == {"500": 2}
+        assert report["recorded"]["p50"] == 0.2
+
+
+def _record(arrival, text, **fields):
+    record = {"arrival": arrival, "text": text, "source_lang": "es", "target_lang": "en",
+              "status": 200, "latency": 0.1, "timings": {"llm": 0.01}}
+    record.update(fields)
+    return record
+
+
+class TestInProcessReplay:
+    """Test cases for replaying through an in-process TranslateLLM."""
+
+    @pytest.fixture
+    def records(self):
+        """Capture with a plain, a back-translated and a timed-out request."""
+        return [
+            _record(0.0, "Hola mundo"),
+            _record(0.01, "¿Qué tal? Bien.", return_in_source_language=True),
+            _record(0.02, "Cuéntame todo", timeout=0.6, status=504,
+                    timings={"llm": 1.0}),
+        ]
+
+    def test_replay_statuses(self, records):
+        """Test each record replays with its recorded status."""
+        sender = InProcessSender(records)
+        try:
+            report = build_report(replay(records, sender, speed=0))
+        finally:
+            sender.service.close()
+        assert report["statuses"] == {"200": 2, "504": 1}
+        assert report["status_mismatches"] == 0
+
+    def test_back_translation(self, records):
+        """Test back-translated records go through the stand-in translator."""
+        sender = InProcessSender(records)
+        try:
+            result = sender.service.process("¿Qué tal? Bien.", target_lang="en",
+                                            return_in_source_language=True)
+        finally:
+            sender.service.close()
+        assert result["detected_language"] == "es"
+        assert result["translated_response"] == result["llm_response"]
+
+
+class TestHTTPSender:
+    """Test cases for replaying against a running instance."""
+
+    @pytest.mark.parametrize("record, timeout", [
+        ({"timeout": 2.0}, 7.0),
+        ({}, 30.0),
+    ])
+    def test_request_timeout(self, record, timeout):
+        """Test requests wait for the record's timeout plus a margin, or the default."""
+        response = MagicMock(status=200)
+        response.__enter__.return_value = response
+        with patch("translate2llm.replay.urllib.request.urlopen",
+                   return_value=response) as urlopen:
+            assert HTTPSender("http://api", timeout=30.0)(record, "Hola") == 200
+        assert urlopen.call_args.kwargs["timeout"] == timeout
+
+    def test_timeout_reported(self):
+        """Test a request that times out is reported with status 0."""
+        with patch("translate2llm.replay.urllib.request.urlopen", side_effect=TimeoutError()):
+            assert HTTPSender("http://api")({}, "Hola") == 0
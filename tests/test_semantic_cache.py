@@ -0,0 +1,164 @@
+"""Unit tests for the semantic cache."""
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from translate2llm.services.exceptions import ConfigurationError
+from translate2llm.services.semantic_cache import HashedNGramEmbedder, SemanticCache
+
+
+@pytest.fixture
+def cache_config():
+    """Semantic cache configuration fixture."""
+    return {
+        "threshold": 0.9,
+        "dim": 512,
+        "max_entries": 2,
+        "max_prompts": 2,
+        "verify_sample_rate": 0.0,
+        "answer_threshold": 0.8
+    }
+
+
+@pytest.fixture
+def cache(cache_config):
+    """SemanticCache fixture."""
+    return SemanticCache(cache_config)
+
+
+class TestHashedNGramEmbedder:
+    """Test cases for HashedNGramEmbedder."""
+
+    def test_paraphrases_are_similar(self):
+        """Test word order and function words do not change the embedding much."""
+        embed = HashedNGramEmbedder()
+        assert embed("how do I reset my password") @ embed("password reset how?") > 0.9
+
+    @pytest.mark.parametrize("first, second", [
+        ("convert 100 USD to EUR", "convert 100 EUR to USD"),
+        ("flights from Paris to London", "flights from London to Paris"),
+        ("What is 2+3?", "What is 3+2?"),
+        ("Is it safe to mix bleach and ammonia?", "Is it not safe to mix bleach and ammonia?"),
+    ])
+    def test_direction_and_negation_differ(self, first, second):
+        """Test swapped directions, operands and negations fall below the default threshold."""
+        embed = HashedNGramEmbedder()
+        assert embed(first) @ embed(second) < 0.9
+
+    def test_unrelated_texts_differ(self):
+        """Test unrelated texts have low similarity."""
+        embed = HashedNGramEmbedder()
+        assert embed("how do I reset my password") @ embed("what is the capital of France") < 0.5
+
+    def test_normalized(self):
+        """Test embeddings have unit length."""
+        assert np.isclose(np.linalg.norm(HashedNGramEmbedder()("Hello world")), 1.0)
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache."""
+
+    def test_paraphrase_hit(self, cache):
+        """Test a paraphrase returns the stored answer without calling the LLM."""
+        compute = Mock(return_value="Use the reset link.")
+        cache.get_or_compute("ns", "how do I reset my password", compute)
+        assert cache.get_or_compute("ns", "password reset how?", compute) == "Use the reset link."
+        compute.assert_called_once()
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_namespaces_are_separate(self, cache):
+        """Test answers are not shared across system prompts."""
+        cache.get_or_compute("a", "reset password", Mock(return_value="A"))
+        assert cache.get_or_compute("b", "reset password", Mock(return_value="B")) == "B"
+
+    def test_reversed_direction_miss(self, cache):
+        """Test a question with swapped direction is computed rather than served."""
+        cache.get_or_compute("ns", "convert 100 USD to EUR", Mock(return_value="92 EUR"))
+        assert cache.get_or_compute("ns", "convert 100 EUR to USD",
+                                    Mock(return_value="108 USD")) == "108 USD"
+
+    def test_below_threshold_miss(self, cache):
+        """Test dissimilar texts are computed."""
+        cache.get_or_compute("ns", "reset password", Mock(return_value="A"))
+        assert cache.get_or_compute("ns", "capital of France", Mock(return_value="Paris")) == "Paris"
+
+    def test_lru_eviction(self, cache):
+        """Test the least recently used entry is evicted when the index is full."""
+        cache.get_or_compute("ns", "reset password", Mock(return_value="A"))
+        cache.get_or_compute("ns", "capital of France", Mock(return_value="B"))
+        cache.get_or_compute("ns", "reset password", Mock(return_value="unused"))
+        cache.get_or_compute("ns", "weather tomorrow", Mock(return_value="C"))
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert cache.get_or_compute("ns", "reset password", Mock(return_value="new")) == "A"
+        assert cache.get_or_compute("ns", "capital of France", Mock(return_value="new")) == "new"
+
+    def test_false_positive_reported(self, cache_config):
+        """Test verified hits with a different fresh answer count as false positives."""
+        cache = SemanticCache(dict(cache_config, verify_sample_rate=1.0))
+        cache.get_or_compute("ns", "reset password", Mock(return_value="Use the reset link."))
+        fresh = cache.get_or_compute("ns", "password reset",
+                                     Mock(return_value="Contact support by phone."))
+        assert fresh == "Contact support by phone."
+        stats = cache.stats()
+        assert stats["verified"] == 1
+        assert stats["false_positives"] == 1
+
+    def test_false_positive_replaced(self, cache_config):
+        """Test a stale answer found by verification is not served again."""
+        cache = SemanticCache(dict(cache_config, verify_sample_rate=1.0))
+        cache.get_or_compute("ns", "reset password", Mock(return_value="Use the reset link."))
+        cache.get_or_compute("ns", "password reset", Mock(return_value="Contact support by phone."))
+        cache.verify_sample_rate = 0.0
+        compute = Mock(return_value="unused")
+        assert cache.get_or_compute("ns", "reset password", compute) == "Contact support by phone."
+        compute.assert_not_called()
+        assert cache.stats()["replaced"] == 1
+
+    @pytest.mark.parametrize("key", ["dim", "max_entries", "max_prompts"])
+    def test_invalid_sizes(self, cache_config, key):
+        """Test zero sizes are rejected instead of failing on the first store."""
+        with pytest.raises(ConfigurationError):
+            SemanticCache(dict(cache_config, **{key: 0}))
+
+    def test_custom_embedder(self, cache_config):
+        """Test a pluggable embedder is used."""
+        embedder = Mock(return_value=np.ones(4, dtype=np.float32))
+        cache = SemanticCache(cache_config, embedder=embedder)
+        cache.get_or_compute("ns", "anything", Mock(return_value="A"))
+        assert cache.get_or_compute("ns", "else", Mock(return_value="B")) == "A"
+
+    def test_invalid_embedder(self, cache_config):
+        """Test an unknown embedder path raises a configuration error."""
+        with pytest.raises(ConfigurationError):
+            SemanticCache(dict(cache_config, embedder="missing.module:factory"))
+
+
+class TestCachedLLMCall:
+    """Test cases for the semantic cache namespace used by TranslateLLM."""
+
+    @pytest.fixture
+    def service(self, cache_config):
+        """TranslateLLM with the semantic cache enabled."""
+        from translate2llm import TranslateLLM
+        service = TranslateLLM()
+        service.semantic_cache = SemanticCache(cache_config)
+        yield service
+        service.close()
+
+    def test_response_language_separates_answers(self, service):
+        """Test answers in one response language are not served for another."""
+        llm_service = service.llm_service
+        service._cached_llm_call(llm_service, "reset password", None, "en", lambda: "Use the link.")
+        assert service._cached_llm_call(llm_service, "reset password", None, "fr",
+                                        lambda: "Utilisez le lien.") == "Utilisez le lien."
+
+    def test_backend_separates_answers(self, service):
+        """Test answers from one LLM endpoint are not served for another."""
+        llm_service = Mock(config=dict(service.llm_service.config))
+        service._cached_llm_call(llm_service, "reset password", None, "en", lambda: "A")
+        llm_service.config["base_url"] = "http://other:11434"
+        assert service._cached_llm_call(llm_service, "reset password", None, "en",
+                                        lambda: "B") == "B"
@@ -0,0 +1,115 @@
+"""Unit tests for the service registry."""
+import time
+import pytest
+from unittest.mock import Mock, patch
+from translate2llm.config.config_manager import Config
+from translate2llm.services.exceptions import ConfigurationError
+from translate2llm.services.service_registry import ServiceRegistry
+
+
+@pytest.fixture
+def profile_config(tmp_path):
+    """Config fixture with two profiles."""
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[llm]\nmodel = mistral\n\n"
+        "[translation]\ntarget_lang = en\n\n"
+        "[registry]\nmax_services = 2\nidle_timeout = 0\nallowed_models = a, b, c, phi3\n\n"
+        "[profile.fast]\nmodel = llama3\ntemperature = 0.5\n\n"
+        "[profile.spanish]\ntarget_lang = es\n"
+    )
+    return Config(str(path))
+
+
+@pytest.fixture
+def registry(profile_config):
+    """ServiceRegistry fixture with mocked service factories."""
+    with patch("translate2llm.services.service_registry.TranslationService",
+               side_effect=lambda config: Mock(config=config)), \
+         patch("translate2llm.services.service_registry.LLMService",
+               side_effect=lambda config: Mock(config=config)):
+        yield ServiceRegistry(profile_config)
+
+
+class TestServiceRegistry:
+    """Test cases for ServiceRegistry."""
+
+    def test_profile_overrides_defaults(self, profile_config):
+        """Test profile values are layered over base sections."""
+        llm_config = profile_config.get_llm_config("fast")
+        assert llm_config["model"] == "llama3"
+        assert llm_config["temperature"] == 0.5
+        assert profile_config.get_translation_config("spanish")["target_lang"] == "es"
+        assert profile_config.get_llm_config()["model"] == "mistral"
+
+    def test_unknown_profile(self, registry):
+        """Test unknown profiles raise a configuration error."""
+        with pytest.raises(ConfigurationError):
+            registry.acquire("missing")
+
+    def test_model_not_allowed(self, registry):
+        """Test models outside the configured and profile models are rejected."""
+        assert registry.allowed_models == {"mistral", "llama3", "a", "b", "c", "phi3"}
+        with pytest.raises(ConfigurationError):
+            registry.acquire("fast", model="unlisted")
+
+    def test_services_are_reused(self, registry):
+        """Test the same profile returns the same pooled instances."""
+        first = registry.acquire("fast")
+        second = registry.acquire("fast")
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    def test_model_override(self, registry):
+        """Test a model override creates a separate LLM service."""
+        _, default_llm = registry.acquire("fast")
+        translation, llm = registry.acquire("fast", model="phi3")
+        assert llm is not default_llm
+        assert llm.config["model"] == "phi3"
+        assert translation is registry.acquire("fast")[0]
+
+    def test_lru_eviction(self, registry):
+        """Test least recently used services are closed when the pool is full."""
+        with registry.lease("fast") as (_, fast):
+            pass
+        for model in ("a", "b"):
+            with registry.lease("fast", model=model):
+                pass
+        fast.close.assert_called_once()
+        assert registry.stats()["llm_services"] == 2
+
+    def test_leased_service_closed_on_release(self, registry):
+        """Test a service evicted while in use is closed only once released."""
+        services = registry.acquire("fast")
+        for model in ("a", "b"):
+            with registry.lease("fast", model=model):
+                pass
+        services[1].close.assert_not_called()
+        registry.release(services)
+        services[1].close.assert_called_once()
+
+    def test_pinned_services_not_evicted(self, registry, profile_config):
+        """Test registered default services are never evicted."""
+        default_translation, default_llm = Mock(), Mock()
+        registry.register(profile_config.get_translation_config(), default_translation,
+                          profile_config.get_llm_config(), default_llm)
+        for model in ("a", "b", "c"):
+            with registry.lease("fast", model=model):
+                pass
+        assert registry.acquire()[1] is default_llm
+        default_llm.close.assert_not_called()
+
+    def test_idle_service_evicted_without_other_profiles(self, registry, profile_config):
+        """Test idle services are closed when only the default services are in use."""
+        registry.register(profile_config.get_translation_config(), Mock(),
+                          profile_config.get_llm_config(), Mock())
+        for pool in (registry._translation_pool, registry._llm_pool):
+            pool.idle_timeout = 0.05
+        with registry.lease("fast") as (_, llm), registry.lease("spanish") as (translation, _):
+            time.sleep(0.1)
+        llm.close.assert_not_called()
+        time.sleep(0.1)
+        registry.release(registry.acquire())
+        translation.close.assert_called_once()
+        llm.close.assert_called_once()
+        assert registry.stats() == {"translation_services": 1, "llm_services": 1}
@@ -1,8 +1,13 @@
 """Unit tests for the translation service."""
+import gc
+import time
+import asyncio
+import weakref
+import threading
 import pytest
 from unittest.mock import Mock, patch
-from src.services.exceptions import TranslationError
-from src.services.translation_service import TranslationService
+from translate2llm.services.exceptions import TranslationError
+from translate2llm.services.translation_service import TranslationService
 
 class TestTranslationService:
     """Test cases for TranslationService."""
@@ -68,4 +73,42 @@ class TestTranslationService:
         mock_translator_class.return_value.detect.side_effect = Exception("Detection failed")
         translation_service.translator = mock_translator_class.return_value
         with pytest.raises(TranslationError):
-            translation_service.detect_language("¡Hola!")
\ No newline at end of file
+            translation_service.detect_language("¡Hola!")
+
+    def test_close_fails_pending_calls(self, translation_service):
+        """Test closing the service fails calls still waiting on its event loop."""
+        async def never_detect(text):
+            await asyncio.sleep(60)
+
+        translation_service.translator = Mock(detect=never_detect)
+        errors = []
+
+        def detect():
+            try:
+                translation_service.detect_language("¡Hola!")
+            except TranslationError as e:
+                errors.append(e)
+
+        caller = threading.Thread(target=detect)
+        caller.start()
+        time.sleep(0.1)
+        translation_service.close()
+        caller.join(timeout=2)
+        assert not caller.is_alive()
+        assert len(errors) == 1
+        with pytest.raises(TranslationError):
+            translation_service.detect_language("¡Hola!")
+
+    def test_cache_is_per_instance(self, translation_config, mock_translator):
+        """Test the translation cache does not keep closed services alive."""
+        service = TranslationService(translation_config)
+        service.translator = mock_translator
+        assert service.translate("¡Hola!", "en", "es") == "Hello"
+        assert service.translate("¡Hola!", "en", "es") == "Hello"
+        mock_translator.translate.assert_called_once()
+
+        ref = weakref.ref(service)
+        service.close()
+        del service
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,104 @@
+"""Opt-in capture of request records to a rotating JSONL file for later replay."""
+import json
+import hashlib
+import logging
+from queue import Queue
+from logging.handlers import QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+from .config.log_handlers import DeferredQueueHandler, RoutingQueueListener, background_listener
+
+logger = logging.getLogger(__name__)
+
+
+class TrafficRecorder:
+    """Writes one JSON record per request to a size-rotated file."""
+
+    def __init__(self, path: str, anonymize: bool = True,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 background: bool = False):
+        """
+        Initialize the traffic recorder.
+
+        Args:
+            path: Path of the JSONL capture file
+            anonymize: Store a hash and the length of the text instead of the text
+            max_bytes: Size at which the capture file is rotated
+            backup_count: Number of rotated files to keep
+            background: Write records from a listener thread instead of the caller,
+                sharing the logging queue and listener when logging runs in the background
+        """
+        logger.info(f"Recording traffic to {path}")
+        self.path = path
+        self.anonymize = anonymize
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes,
+                                            backupCount=backup_count, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        # A dedicated, non-propagating logger gives thread-safe writes and rotation
+        self._logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._listener: Optional[QueueListener] = None
+        self._shared_listener: Optional[RoutingQueueListener] = None
+        if background:
+            self._shared_listener = background_listener()
+            if self._shared_listener is not None:
+                self._shared_listener.add_route(self._logger.name, self._handler)
+                self._logger.addHandler(DeferredQueueHandler(self._shared_listener.queue))
+            else:
+                record_queue: Queue = Queue(-1)
+                self._listener = QueueListener(record_queue, self._handler)
+                self._listener.start()
+                self._logger.addHandler(DeferredQueueHandler(record_queue))
+        else:
+            self._logger.addHandler(self._handler)
+
+    def build_record(self, arrival: float, text: str, target_lang: Optional[str],
+                     system_prompt: Optional[str], status: int, latency: float,
+                     result: Optional[Dict] = None, **extra) -> Dict:
+        """
+        Build a capture record for a request.
+
+        Args:
+            arrival: Wall-clock arrival timestamp (seconds since the epoch)
+            text: Request text
+            target_lang: Requested target language
+            system_prompt: Requested system prompt
+            status: HTTP status code of the response
+            latency: Seconds from arrival to response
+            result: Result of ``TranslateLLM.process`` if the request succeeded
+            **extra: Further request fields to record (profile, model, timeout,
+                return_in_source_language)
+        """
+        result = result or {}
+        record = {
+            "arrival": arrival,
+            "text_length": len(text),
+            "text_sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            "source_lang": result.get("detected_language"),
+            "target_lang": target_lang,
+            "system_prompt": system_prompt,
+            "status": status,
+            "latency": latency,
+            "timings": result.get("timings", {}),
+        }
+        if not self.anonymize:
+            record["text"] = text
+        record.update({key: value for key, value in extra.items() if value is not None})
+        return record
+
+    def record(self, *args, **kwargs) -> None:
+        """Build a record (see ``build_record``) and append it to the capture file."""
+        try:
+            self._logger.info(json.dumps(self.build_record(*args, **kwargs), ensure_ascii=False))
+        except Exception as e:
+            logger.error(f"Failed to record request: {str(e)}")
+
+    def close(self) -> None:
+        """Flush and close the capture file."""
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+        if self._listener is not None:
+            self._listener.stop()
+        if self._shared_listener is not None:
+            self._shared_listener.remove_route(self._logger.name)
+        self._handler.close()
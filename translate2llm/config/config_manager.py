@@ -1,10 +1,15 @@
 """Configuration management for the application."""
 import os
+import atexit
 import logging
 import configparser
+from queue import Queue
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
+from ..services.exceptions import ConfigurationError
+from .log_handlers import DeferredQueueHandler, RoutingQueueListener, SamplingFilter
 
 # Load environment variables
 load_dotenv()
@@ -26,38 +31,171 @@ class Config:
         else:
             logger.warning(f"Configuration file not found at {config_path}")
 
-    def get_llm_config(self) -> Dict:
-        """Load LLM configuration."""
+    def get_profiles(self) -> List[str]:
+        """Return the names of all ``[profile.<name>]`` sections."""
+        prefix = "profile."
+        return [section[len(prefix):] for section in self.config.sections()
+                if section.startswith(prefix)]
+
+    def _get_section(self, section: str, profile: Optional[str]):
+        """
+        Return a lookup for ``section`` with ``profile`` values layered on top.
+
+        Raises:
+            ConfigurationError: If the profile is not defined
+        """
+        if not profile and self.config.has_section(section):
+            return self.config[section]
+
+        merged = configparser.ConfigParser(interpolation=None)
+        merged.add_section(section)
+        if self.config.has_section(section):
+            merged.read_dict({section: dict(self.config.items(section, raw=True))})
+        if profile:
+            profile_section = f"profile.{profile}"
+            if not self.config.has_section(profile_section):
+                raise ConfigurationError(f"Unknown configuration profile: {profile}")
+            merged.read_dict({section: dict(self.config.items(profile_section, raw=True))})
+        return merged[section]
+
+    def get_llm_config(self, profile: Optional[str] = None) -> Dict:
+        """Load LLM configuration, optionally overridden by a profile."""
+        section = self._get_section("llm", profile)
         llm_config = {
-            "model": self.config.get("llm", "model", fallback="mistral"),
-            "model_provider": self.config.get("llm", "model_provider", fallback="ollama"),
-            "temperature": self.config.getfloat("llm", "temperature", fallback=0.0),
-            "base_url": self.config.get("llm", "base_url", fallback="http://localhost:11434"),
-            "max_tokens": self.config.getint("llm", "max_tokens", fallback=1000),
+            "model": section.get("model", fallback="mistral"),
+            "model_provider": section.get("model_provider", fallback="ollama"),
+            "temperature": section.getfloat("temperature", fallback=0.0),
+            "base_url": section.get("base_url", fallback="http://localhost:11434"),
+            "max_tokens": section.getint("max_tokens", fallback=1000),
             "api_key": os.getenv("LLM_API_KEY")
         }
         logger.debug(f"Loaded LLM config: {llm_config}")
         return llm_config
 
-    def get_translation_config(self) -> Dict:
-        """Load translation configuration."""
+    def get_translation_config(self, profile: Optional[str] = None) -> Dict:
+        """Load translation configuration, optionally overridden by a profile."""
+        section = self._get_section("translation", profile)
         translation_config = {
-            "source_lang": self.config.get("translation", "source_lang", fallback="auto"),
-            "target_lang": self.config.get("translation", "target_lang", fallback="en"),
-            "use_cache": self.config.getboolean("translation", "use_cache", fallback=True),
-            "timeout": self.config.getint("translation", "timeout", fallback=5),
+            "source_lang": section.get("source_lang", fallback="auto"),
+            "target_lang": section.get("target_lang", fallback="en"),
+            "use_cache": section.getboolean("use_cache", fallback=True),
+            "timeout": section.getint("timeout", fallback=5),
+            "back_translation_workers": section.getint("back_translation_workers", fallback=4),
             "api_key": os.getenv("TRANSLATION_API_KEY")
         }
         logger.debug(f"Loaded translation config: {translation_config}")
         return translation_config
 
+    def get_registry_config(self) -> Dict:
+        """Load service registry configuration."""
+        registry_config = {
+            "max_services": self.config.getint("registry", "max_services", fallback=8),
+            "idle_timeout": self.config.getfloat("registry", "idle_timeout", fallback=600.0),
+            "allowed_models": [model.strip() for model in
+                               self.config.get("registry", "allowed_models", fallback="").split(",")
+                               if model.strip()]
+        }
+        logger.debug(f"Loaded registry config: {registry_config}")
+        return registry_config
+
+    def get_deadline_config(self) -> Dict:
+        """Load request deadline configuration."""
+        deadline_config = {
+            "default_timeout": self.config.getfloat("deadline", "default_timeout", fallback=0.0),
+            "min_budgets": {
+                "detection": self.config.getfloat("deadline", "min_detection_budget", fallback=0.1),
+                "translation": self.config.getfloat("deadline", "min_translation_budget", fallback=0.2),
+                "llm": self.config.getfloat("deadline", "min_llm_budget", fallback=0.5),
+                "back_translation": self.config.getfloat("deadline", "min_back_translation_budget",
+                                                         fallback=0.1)
+            }
+        }
+        logger.debug(f"Loaded deadline config: {deadline_config}")
+        return deadline_config
+
+    def get_profiling_config(self) -> Dict:
+        """Load profiling configuration."""
+        profiling_config = {
+            "sample_rate": self.config.getfloat("profiling", "sample_rate", fallback=0.0),
+            "interval": self.config.getfloat("profiling", "interval", fallback=0.005),
+            "max_window": self.config.getfloat("profiling", "max_window", fallback=60.0),
+            "endpoints": self.config.getboolean("profiling", "endpoints", fallback=False)
+        }
+        logger.debug(f"Loaded profiling config: {profiling_config}")
+        return profiling_config
+
+    def get_capture_config(self) -> Dict:
+        """Load traffic capture configuration."""
+        capture_config = {
+            "enabled": self.config.getboolean("capture", "enabled", fallback=False),
+            "path": self.config.get("capture", "path", fallback="capture.jsonl"),
+            "anonymize": self.config.getboolean("capture", "anonymize", fallback=True),
+            "max_bytes": self.config.getint("capture", "max_bytes", fallback=10 * 1024 * 1024),
+            "backup_count": self.config.getint("capture", "backup_count", fallback=5)
+        }
+        logger.debug(f"Loaded capture config: {capture_config}")
+        return capture_config
+
+    def get_semantic_cache_config(self) -> Dict:
+        """Load semantic cache configuration."""
+        semantic_cache_config = {
+            "enabled": self.config.getboolean("semantic_cache", "enabled", fallback=False),
+            "threshold": self.config.getfloat("semantic_cache", "threshold", fallback=0.9),
+            "embedder": self.config.get("semantic_cache", "embedder", fallback="hashed"),
+            "dim": self.config.getint("semantic_cache", "dim", fallback=512),
+            "max_entries": self.config.getint("semantic_cache", "max_entries", fallback=2000),
+            "max_prompts": self.config.getint("semantic_cache", "max_prompts", fallback=16),
+            "verify_sample_rate": self.config.getfloat("semantic_cache", "verify_sample_rate",
+                                                       fallback=0.0),
+            "answer_threshold": self.config.getfloat("semantic_cache", "answer_threshold",
+                                                     fallback=0.8)
+        }
+        logger.debug(f"Loaded semantic cache config: {semantic_cache_config}")
+        return semantic_cache_config
+
+    def get_logging_config(self) -> Dict:
+        """Load logging configuration."""
+        logging_config = {
+            "level": os.getenv("LOG_LEVEL") or self.config.get("logging", "level", fallback="INFO"),
+            "format": self.config.get("logging", "format",
+                                      fallback="%(asctime)s | %(levelname)s | %(name)s | %(message)s"),
+            "background": self.config.getboolean("logging", "background", fallback=False),
+            "request_summary": self.config.getboolean("logging", "request_summary", fallback=False),
+            "sample_rate": self.config.getfloat("logging", "sample_rate", fallback=1.0)
+        }
+        return logging_config
+
     def setup_logging(self) -> None:
-        """Configure logging based on configuration."""
-        log_level = os.getenv("LOG_LEVEL") or self.config.get("logging", "level", fallback="INFO")
-        log_format = self.config.get("logging", "format", 
-                                   fallback="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+        """
+        Configure logging based on configuration.
+
+        With ``background`` enabled the root handlers are moved behind a queue
+        served by a listener thread, so request threads and the event loop only
+        enqueue records. ``sample_rate`` below 1 drops a fraction of DEBUG and
+        INFO records before they are queued or written.
+        """
+        logging_config = self.get_logging_config()
         
         logging.basicConfig(
-            level=getattr(logging, log_level),
-            format=log_format
-        )
\ No newline at end of file
+            level=getattr(logging, logging_config["level"]),
+            format=logging_config["format"]
+        )
+
+        root = logging.getLogger()
+        if logging_config["background"] and not any(
+                isinstance(handler, QueueHandler) for handler in root.handlers):
+            log_queue: Queue = Queue(-1)
+            listener = RoutingQueueListener(log_queue, *root.handlers,
+                                            respect_handler_level=True)
+            root.handlers = [DeferredQueueHandler(log_queue, listener)]
+            listener.start()
+            atexit.register(listener.stop)
+            logger.debug("Logging through background queue listener")
+
+        if logging_config["sample_rate"] < 1.0:
+            for handler in root.handlers:
+                sampling = [f for f in handler.filters if isinstance(f, SamplingFilter)]
+                if sampling:
+                    sampling[0].sample_rate = logging_config["sample_rate"]
+                else:
+                    handler.addFilter(SamplingFilter(logging_config["sample_rate"]))
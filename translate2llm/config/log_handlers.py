@@ -0,0 +1,81 @@
+"""Logging handlers and filters that keep logging off the request hot path."""
+import random
+import logging
+import threading
+from typing import Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a random fraction of DEBUG and INFO records; WARNING and above always pass."""
+
+    def __init__(self, sample_rate: float = 1.0):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves message formatting to the listener thread.
+
+    The standard ``QueueHandler.prepare`` formats every record in the calling
+    thread so it can be pickled. The queue here stays in-process, so the
+    record is enqueued as-is and formatted by the background listener.
+    """
+
+    def __init__(self, queue, listener: Optional["RoutingQueueListener"] = None):
+        super().__init__(queue)
+        self.listener = listener
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RoutingQueueListener(QueueListener):
+    """
+    Queue listener that hands the records of selected loggers to their own handler.
+
+    Lets other writers, such as the traffic recorder, share the background
+    logging queue and thread without their records reaching the root handlers.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._routes: Dict[str, logging.Handler] = {}
+
+    def add_route(self, name: str, handler: logging.Handler) -> None:
+        """Send records of logger ``name`` to ``handler`` only."""
+        self._routes[name] = handler
+
+    def remove_route(self, name: str, timeout: float = 5.0) -> None:
+        """Stop routing logger ``name`` once the records already queued for it are handled."""
+        if self._thread is not None:
+            flushed = threading.Event()
+            marker = logging.makeLogRecord({"name": name, "route_flushed": flushed})
+            self.queue.put_nowait(marker)
+            flushed.wait(timeout)
+        self._routes.pop(name, None)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        flushed = getattr(record, "route_flushed", None)
+        if flushed is not None:
+            flushed.set()
+            return
+        handler = self._routes.get(record.name)
+        if handler is None:
+            super().handle(record)
+        elif record.levelno >= handler.level:
+            handler.handle(self.prepare(record))
+
+
+def background_listener() -> Optional[RoutingQueueListener]:
+    """Return the listener serving the root logger in background mode, if any."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DeferredQueueHandler) and handler.listener is not None:
+            return handler.listener
+    return None
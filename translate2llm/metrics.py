@@ -0,0 +1,34 @@
+"""In-process counters for service metrics."""
+from threading import Lock
+from typing import Dict
+
+
+class Metrics:
+    """Thread-safe named counters."""
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to the counter ``name``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name: str) -> float:
+        """Return the current value of the counter ``name``."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return a copy of all counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._counters.clear()
+
+
+metrics = Metrics()
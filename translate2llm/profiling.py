@@ -0,0 +1,156 @@
+"""Sampling profiler producing collapsed stacks for flamegraph tools."""
+import os
+import sys
+import time
+import random
+import logging
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from threading import Lock, Thread, get_ident
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_NULL_SCOPE = nullcontext()
+
+
+def _frame_label(frame) -> str:
+    """Return a stable label for a frame: function (package/module.py:first_line)."""
+    code = frame.f_code
+    path = code.co_filename.replace(os.sep, "/").rsplit("/", 2)
+    return f"{code.co_name} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+def _collapse(frame) -> str:
+    """Return the stack ending at ``frame`` as a root-first, semicolon separated string."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Format stack counts as collapsed-stack lines accepted by flamegraph.pl and speedscope."""
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+
+
+class Profiler:
+    """
+    Samples thread stacks while a profiling window is open or a sampled request runs.
+
+    The sampler thread only runs while there is something to profile, and
+    unsampled requests only pay for a single comparison.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, interval: float = 0.005):
+        """
+        Initialize the profiler.
+
+        Args:
+            sample_rate: Fraction of requests to profile (0 disables request sampling)
+            interval: Seconds between stack samples
+        """
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.request_stacks: Counter = Counter()
+        self.sampled_requests = 0
+        self._windows: List[Counter] = []
+        self._request_threads: Dict[int, int] = {}
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def configure(self, sample_rate: Optional[float] = None,
+                  interval: Optional[float] = None) -> None:
+        """Update the request sample rate and sampling interval at runtime."""
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f"Sample rate must be between 0 and 1: {sample_rate}")
+            self.sample_rate = sample_rate
+        if interval is not None:
+            if interval <= 0:
+                raise ValueError(f"Sampling interval must be positive: {interval}")
+            self.interval = interval
+        logger.debug(f"Profiler configured with sample_rate={self.sample_rate}, "
+                     f"interval={self.interval}")
+
+    def request_scope(self):
+        """Return a context manager that profiles the current thread if the request is sampled."""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return _NULL_SCOPE
+        return self._profile_thread(get_ident())
+
+    @contextmanager
+    def _profile_thread(self, thread_id: int):
+        with self._lock:
+            self._request_threads[thread_id] = self._request_threads.get(thread_id, 0) + 1
+            self.sampled_requests += 1
+            self._ensure_running()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._request_threads[thread_id] -= 1
+                if not self._request_threads[thread_id]:
+                    del self._request_threads[thread_id]
+
+    def start_window(self) -> Counter:
+        """Start sampling every thread; returns the counter the samples are added to."""
+        stacks: Counter = Counter()
+        with self._lock:
+            self._windows.append(stacks)
+            self._ensure_running()
+        return stacks
+
+    def stop_window(self, stacks: Counter) -> str:
+        """Stop a window started with ``start_window`` and return its collapsed stacks."""
+        with self._lock:
+            self._windows.remove(stacks)
+        return format_collapsed(stacks)
+
+    def profile(self, seconds: float) -> str:
+        """Sample every thread for ``seconds`` and return the collapsed stacks."""
+        stacks = self.start_window()
+        try:
+            time.sleep(seconds)
+        finally:
+            output = self.stop_window(stacks)
+        return output
+
+    def request_profile(self, reset: bool = False) -> str:
+        """Return the collapsed stacks collected from sampled requests."""
+        with self._lock:
+            output = format_collapsed(self.request_stacks)
+            if reset:
+                self.request_stacks = Counter()
+                self.sampled_requests = 0
+        return output
+
+    def _ensure_running(self) -> None:
+        """Start the sampler thread if needed. Caller must hold the lock."""
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="profiler-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        own_id = get_ident()
+        while True:
+            with self._lock:
+                if not self._windows and not self._request_threads:
+                    self._thread = None
+                    return
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_id:
+                        continue
+                    sampled_request = thread_id in self._request_threads
+                    if not self._windows and not sampled_request:
+                        continue
+                    stack = _collapse(frame)
+                    for window in self._windows:
+                        window[stack] += 1
+                    if sampled_request:
+                        self.request_stacks[stack] += 1
+            time.sleep(self.interval)
+
+
+profiler = Profiler()
@@ -0,0 +1,291 @@
+"""Replay captured traffic at its original or a scaled rate and compare latencies.
+
+Usage:
+    python -m translate2llm.replay capture.jsonl --url http://localhost:8000
+    python -m translate2llm.replay capture.jsonl --in-process --speed 2
+"""
+import sys
+import json
+import time
+import logging
+import argparse
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from .translate2llm import TranslateLLM
+from .services.deadline import Deadline
+from .services.exceptions import ConfigurationError, RequestCancelledError, DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+# Filler used to rebuild anonymized texts of the recorded length
+_FILLER = "lorem ipsum dolor sit amet consectetur adipiscing elit "
+
+# Seconds allowed past a record's own timeout before HTTPSender gives up on it
+_TIMEOUT_MARGIN = 5.0
+
+
+def load_capture(path: str) -> List[Dict]:
+    """Load capture records from a JSONL file, ordered by arrival time."""
+    records = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return sorted(records, key=lambda record: record["arrival"])
+
+
+def replay_text(record: Dict, index: int) -> str:
+    """Return the recorded text, or a unique filler text of the recorded length."""
+    if "text" in record:
+        return record["text"]
+    prefix = f"[{index}] "
+    length = max(record.get("text_length", 0) - len(prefix), 0)
+    return prefix + (_FILLER * (length // len(_FILLER) + 1))[:length]
+
+
+class HTTPSender:
+    """Re-issues records against a running API instance."""
+
+    def __init__(self, url: str, timeout: float = 300.0):
+        """
+        Initialize the sender.
+
+        Args:
+            url: Base URL of the API
+            timeout: Seconds to wait for a response to a record without its own timeout
+        """
+        self.url = url.rstrip("/") + "/translate"
+        self.timeout = timeout
+
+    def __call__(self, record: Dict, text: str) -> int:
+        payload = {
+            "text": text,
+            "target_lang": record.get("target_lang") or "en",
+            "system_prompt": record.get("system_prompt"),
+            "profile": record.get("profile"),
+            "model": record.get("model"),
+            "timeout": record.get("timeout"),
+            "return_in_source_language": record.get("return_in_source_language"),
+        }
+        body = json.dumps({k: v for k, v in payload.items() if v is not None}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body,
+                                         headers={"Content-Type": "application/json"})
+        timeout = (record["timeout"] + _TIMEOUT_MARGIN) if record.get("timeout") else self.timeout
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+        except (urllib.error.URLError, TimeoutError) as e:
+            logger.error(f"Replay request failed: {str(e)}")
+            return 0
+
+
+class _StandInResult:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class StandInTranslator:
+    """Translator stand-in that returns the input after the recorded stage duration."""
+
+    def __init__(self, records: Dict[str, Dict], time_scale: float = 1.0):
+        self.records = records
+        self.time_scale = time_scale
+
+    def _sleep(self, text: str, stage: str) -> Dict:
+        record = self.records.get(text, {})
+        time.sleep(record.get("timings", {}).get(stage, 0.0) * self.time_scale)
+        return record
+
+    def detect(self, text, **kwargs):
+        record = self._sleep(text, "detection")
+        return _StandInResult(lang=record.get("source_lang") or "en")
+
+    def translate(self, text, dest="en", src="auto", **kwargs):
+        self._sleep(text, "translation")
+        return _StandInResult(text=text, src=src, dest=dest)
+
+
+class StandInChatModel:
+    """Chat model stand-in that answers after the recorded LLM stage duration."""
+
+    def __init__(self, records: Dict[str, Dict], time_scale: float = 1.0):
+        self.records = records
+        self.time_scale = time_scale
+
+    def invoke(self, messages, **kwargs):
+        text = messages[-1]["content"] if isinstance(messages, list) else str(messages)
+        record = self.records.get(text, {})
+        time.sleep(record.get("timings", {}).get("llm", 0.0) * self.time_scale)
+        return _StandInResult(content=f"Replayed answer for {len(text)} characters.")
+
+    def stream(self, messages, **kwargs):
+        yield self.invoke(messages, **kwargs)
+
+
+class InProcessSender:
+    """Replays records through an in-process ``TranslateLLM`` backed by stand-ins."""
+
+    def __init__(self, records: List[Dict], config_path: str = "config.ini",
+                 time_scale: float = 1.0):
+        by_text = {replay_text(record, i): record for i, record in enumerate(records)}
+        self.service = TranslateLLM(config_path)
+        self.service.translation_service.translator = StandInTranslator(by_text, time_scale)
+        self.service.llm_service.llm = StandInChatModel(by_text, time_scale)
+
+    def __call__(self, record: Dict, text: str) -> int:
+        timeout = record.get("timeout")
+        try:
+            # Profiles and models are not replayed: they would build real backends
+            self.service.process(text, target_lang=record.get("target_lang"),
+                                 system_prompt=record.get("system_prompt"),
+                                 deadline=Deadline(timeout) if timeout else None,
+                                 return_in_source_language=bool(
+                                     record.get("return_in_source_language")))
+            return 200
+        except DeadlineExceededError:
+            return 504
+        except RequestCancelledError:
+            return 499
+        except ConfigurationError:
+            return 400
+        except Exception as e:
+            logger.error(f"Replay request failed: {str(e)}")
+            return 500
+
+
+def replay(records: List[Dict], send: Callable[[Dict, str], int], speed: float = 1.0,
+           max_workers: int = 32) -> List[Dict]:
+    """
+    Re-issue records with their original inter-arrival gaps divided by ``speed``.
+
+    Args:
+        records: Capture records ordered by arrival
+        send: Callable issuing one record and returning its status code
+        speed: Rate multiplier (2 replays twice as fast; 0 sends as fast as possible)
+        max_workers: Maximum number of requests in flight
+
+    Returns:
+        List of results with recorded and replayed latency and status
+    """
+    if not records:
+        return []
+    first_arrival = records[0]["arrival"]
+    start = time.monotonic()
+    due_times = [start + ((record["arrival"] - first_arrival) / speed if speed > 0 else 0.0)
+                 for record in records]
+
+    def run(index: int, record: Dict) -> Dict:
+        text = replay_text(record, index)
+        issued = time.monotonic()
+        status = send(record, text)
+        return {
+            "recorded_latency": record.get("latency"),
+            "recorded_status": record.get("status"),
+            "latency": time.monotonic() - issued,
+            "status": status,
+            "lag": issued - due_times[index],
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for index, record in enumerate(records):
+            delay = due_times[index] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(run, index, record))
+        return [future.result() for future in futures]
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def _summary(values: List[float]) -> Dict:
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else None,
+        "p50": _percentile(values, 50),
+        "p90": _percentile(values, 90),
+        "p99": _percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+def build_report(results: List[Dict]) -> Dict:
+    """Summarize recorded versus replayed latencies and status codes."""
+    recorded = [r["recorded_latency"] for r in results if r["recorded_latency"] is not None]
+    replayed = [r["latency"] for r in results]
+    statuses: Dict[str, int] = {}
+    for r in results:
+        statuses[str(r["status"])] = statuses.get(str(r["status"]), 0) + 1
+    return {
+        "requests": len(results),
+        "status_mismatches": sum(1 for r in results
+                                 if r["recorded_status"] is not None
+                                 and r["status"] != r["recorded_status"]),
+        "statuses": statuses,
+        "recorded": _summary(recorded),
+        "replayed": _summary(replayed),
+        "schedule_lag": _summary([r["lag"] for r in results]),
+    }
+
+
+def format_report(report: Dict) -> str:
+    """Format a report from ``build_report`` as a text table."""
+    def fmt(value):
+        return "-" if value is None else f"{value * 1000:.1f}ms"
+
+    lines = [
+        f"requests: {report['requests']}  statuses: {report['statuses']}  "
+        f"status mismatches: {report['status_mismatches']}",
+        f"{'':<10}{'recorded':>12}{'replayed':>12}{'delta':>12}",
+    ]
+    for key in ("mean", "p50", "p90", "p99", "max"):
+        recorded, replayed = report["recorded"][key], report["replayed"][key]
+        delta = None if recorded is None or replayed is None else replayed - recorded
+        lines.append(f"{key:<10}{fmt(recorded):>12}{fmt(replayed):>12}{fmt(delta):>12}")
+    lines.append(f"schedule lag p99: {fmt(report['schedule_lag']['p99'])}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Replay captured Translate2LLM traffic.")
+    parser.add_argument("capture", help="Path of the JSONL capture file")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running API instance")
+    target.add_argument("--in-process", action="store_true",
+                        help="Replay through an in-process TranslateLLM with stand-in backends")
+    parser.add_argument("--config", default="config.ini", help="Config file for --in-process")
+    parser.add_argument("--http-timeout", type=float, default=300.0,
+                        help="Seconds to wait for records without a timeout (--url)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Arrival rate multiplier (0 sends as fast as possible)")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="Multiplier for stand-in stage durations (--in-process)")
+    parser.add_argument("--workers", type=int, default=32, help="Maximum requests in flight")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    records = load_capture(args.capture)
+    if args.url:
+        send = HTTPSender(args.url, timeout=args.http_timeout)
+    else:
+        send = InProcessSender(records, args.config, args.time_scale)
+
+    report = build_report(replay(records, send, speed=args.speed, max_workers=args.workers))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
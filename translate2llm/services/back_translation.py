@@ -0,0 +1,121 @@
+"""Sentence-by-sentence back-translation of streamed LLM responses."""
+import re
+import logging
+import contextvars
+from concurrent.futures import Executor, Future
+from typing import List, Tuple
+from .deadline import current_deadline
+from .translation_service import TranslationService
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: terminal punctuation followed by whitespace, CJK full stops, or line breaks
+_BOUNDARY = re.compile(r"(?<=[.!?])[ \t]+|(?<=[。！？])|\n+")
+
+# Text ending in a likely abbreviation ("Dr.", "J.", "e.g.") rather than a sentence; a
+# short word wrongly kept here only delays its sentence until the next boundary
+_ABBREVIATION = re.compile(r"(?<!\S)(?:\w|[A-Z][a-z]{0,2}|\w+\.\w+)\.$")
+
+
+class SentenceBuffer:
+    """Accumulates streamed text and splits off complete sentences."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """
+        Add a chunk and return the sentences it completed.
+
+        Returns:
+            List of (sentence, separator) pairs; the separator is the text
+            that followed the sentence, kept so the output can be rejoined
+        """
+        self._buffer += chunk
+        sentences = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            # A boundary at the very end may still grow with the next chunk
+            if match.end() == len(self._buffer) and match.group():
+                break
+            if match.end() == start:
+                continue
+            if match.group()[:1] in (" ", "\t") and \
+                    _ABBREVIATION.search(self._buffer, start, match.start()):
+                continue
+            sentences.append((self._buffer[start:match.start()], match.group()))
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """Return any remaining text as a final sentence."""
+        remainder, self._buffer = self._buffer, ""
+        return [(remainder, "")] if remainder else []
+
+
+class BackTranslator:
+    """Translates sentences of a streamed response as soon as each one completes."""
+
+    def __init__(self, translation_service: TranslationService, executor: Executor,
+                 source_lang: str, target_lang: str):
+        """
+        Initialize the back-translator.
+
+        Args:
+            translation_service: Service used to translate each sentence
+            executor: Executor the sentence translations run on
+            source_lang: Language of the streamed response
+            target_lang: Language to translate the response into
+        """
+        self.translation_service = translation_service
+        self.executor = executor
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self._buffer = SentenceBuffer()
+        self._pending: List[Tuple[Future, str]] = []
+
+    def feed(self, chunk: str) -> None:
+        """Add a response chunk, submitting any sentences it completes."""
+        for sentence, separator in self._buffer.feed(chunk):
+            self._submit(sentence, separator)
+
+    def _submit(self, sentence: str, separator: str) -> None:
+        if not sentence.strip():
+            future: Future = Future()
+            future.set_result(sentence)
+            self._pending.append((future, separator))
+            return
+        # Each task runs in a copy of the caller's context so it sees the request deadline
+        context = contextvars.copy_context()
+        future = self.executor.submit(context.run, self.translation_service.translate,
+                                      sentence, target_lang=self.target_lang,
+                                      source_lang=self.source_lang)
+        self._pending.append((future, separator))
+
+    def result(self) -> str:
+        """
+        Submit the final sentence and return the joined translation.
+
+        Raises:
+            TranslationError: If a sentence fails to translate
+        """
+        for sentence, separator in self._buffer.flush():
+            self._submit(sentence, separator)
+
+        deadline = current_deadline()
+        parts = []
+        try:
+            for future, separator in self._pending:
+                translated = deadline.wait(future) if deadline is not None else future.result()
+                parts.append(translated + separator)
+        finally:
+            for future, _ in self._pending:
+                future.cancel()
+        logger.debug("Back-translated %d sentences", len(self._pending))
+        return "".join(parts)
+
+    def cancel(self) -> None:
+        """Cancel sentence translations that have not started."""
+        for future, _ in self._pending:
+            future.cancel()
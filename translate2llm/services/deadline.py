@@ -0,0 +1,110 @@
+"""Per-request deadlines and cancellation shared across service calls."""
+import time
+import logging
+import concurrent.futures
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Event
+from typing import Iterator, Optional
+from .exceptions import DeadlineExceededError, RequestCancelledError
+
+logger = logging.getLogger(__name__)
+
+# Interval at which blocking waits re-check for cancellation
+_POLL_INTERVAL = 0.05
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """Tracks the remaining time budget of a request and whether it was cancelled."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialize the deadline.
+
+        Args:
+            timeout: Seconds until the deadline passes (None for no time limit)
+        """
+        self.expires_at = time.monotonic() + timeout if timeout else None
+        self.reason: Optional[str] = None
+        self._cancelled = Event()
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left before the deadline, or None if unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Return True if the deadline has passed."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if the request was cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the request so in-flight calls stop at their next check."""
+        if not self._cancelled.is_set():
+            self.reason = reason
+            self._cancelled.set()
+            logger.debug(f"Request cancelled: {reason}")
+
+    def check(self, stage: str, min_budget: float = 0.0) -> None:
+        """
+        Ensure the request may continue into ``stage``.
+
+        Args:
+            stage: Name of the stage about to run
+            min_budget: Minimum seconds the stage needs to be worth starting
+
+        Raises:
+            RequestCancelledError: If the request was cancelled
+            DeadlineExceededError: If the deadline passed or the remaining budget
+                is below ``min_budget``
+        """
+        if self.cancelled:
+            if self.reason == "deadline":
+                raise DeadlineExceededError(f"Deadline exceeded before {stage}")
+            raise RequestCancelledError(f"Request cancelled before {stage}: {self.reason}")
+        remaining = self.remaining()
+        if remaining is not None and (remaining <= 0 or remaining < min_budget):
+            raise DeadlineExceededError(
+                f"Deadline exceeded before {stage}: {remaining:.3f}s left, "
+                f"{min_budget:.3f}s needed"
+            )
+
+    def wait(self, future: concurrent.futures.Future):
+        """
+        Wait for ``future`` while honouring the deadline and cancellation.
+
+        Raises:
+            RequestCancelledError: If the request is cancelled while waiting
+            DeadlineExceededError: If the deadline passes while waiting
+        """
+        while True:
+            remaining = self.remaining()
+            timeout = _POLL_INTERVAL if remaining is None else min(_POLL_INTERVAL, remaining)
+            try:
+                return future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                if self.cancelled or self.expired():
+                    future.cancel()
+                    self.check("completion")
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the request being processed, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` the current deadline for calls made within the block."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -10,4 +10,12 @@ class LLMError(Exception):
 
 class ConfigurationError(Exception):
     """Raised when there is a configuration error."""
-    pass
\ No newline at end of file
+    pass
+
+class RequestCancelledError(Exception):
+    """Raised when a request is cancelled before it completes."""
+    pass
+
+class DeadlineExceededError(RequestCancelledError):
+    """Raised when a request's deadline passes or leaves too little budget for a stage."""
+    pass
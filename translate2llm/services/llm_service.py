@@ -1,9 +1,10 @@
 """LLM service implementation."""
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from langchain.chat_models.base import init_chat_model, BaseChatModel
-from src.constants import DEFAULT_MODEL_NAME, DEFAULT_MODEL_PROVIDER, DEFAULT_MODEL_URL
-from src.services.exceptions import LLMError
+from ..constants import DEFAULT_MODEL_NAME, DEFAULT_MODEL_PROVIDER, DEFAULT_MODEL_URL
+from .exceptions import LLMError, RequestCancelledError
+from .deadline import current_deadline
 
 
 logger = logging.getLogger(__name__)
@@ -50,23 +51,77 @@ class LLMService:
             return ""
 
         try:
-            # Prepare the messages
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": text})
+            messages = self._build_messages(text, system_prompt)
 
-            logger.info("Processing text with LLM")
+            logger.debug("Processing text with LLM")
+            if current_deadline() is not None:
+                return "".join(self._stream_chunks(messages))
             response = self.llm.invoke(messages)
 
             if not response or not hasattr(response, 'content'):
                 raise LLMError("Invalid response from LLM")
             return str(response.content)
 
+        except RequestCancelledError:
+            raise
         except Exception as e:
-            logger.error(f"LLM processing error: {str(e)}")
+            logger.error("LLM processing error: %s", e)
             raise LLMError(f"LLM processing failed: {str(e)}")
 
+    def stream_text(self, text: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream the LLM response to text chunk by chunk.
+        
+        Args:
+            text: Text to process
+            system_prompt: Optional system prompt to guide the model
+            
+        Yields:
+            str: Response content chunks as they are generated
+            
+        Raises:
+            LLMError: If text processing fails
+        """
+        if not text or not text.strip():
+            logger.warning("Empty text provided for LLM processing")
+            return
+
+        try:
+            logger.debug("Streaming text with LLM")
+            yield from self._stream_chunks(self._build_messages(text, system_prompt))
+        except RequestCancelledError:
+            raise
+        except Exception as e:
+            logger.error("LLM processing error: %s", e)
+            raise LLMError(f"LLM processing failed: {str(e)}")
+
+    def _build_messages(self, text: str, system_prompt: Optional[str]) -> List[Dict]:
+        """Prepare the chat messages for a request."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": text})
+        return messages
+
+    def _stream_chunks(self, messages: List[Dict]) -> Iterator[str]:
+        """
+        Stream response chunks, stopping generation once the request is cancelled.
+
+        Closing the stream closes the connection to the model server, which
+        stops it from generating tokens nobody will read.
+        """
+        deadline = current_deadline()
+        stream = self.llm.stream(messages)
+        try:
+            for chunk in stream:
+                if deadline is not None:
+                    deadline.check("llm generation")
+                yield str(getattr(chunk, "content", chunk))
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+
     def is_available(self) -> bool:
         """Check if the LLM service is available."""
         try:
@@ -0,0 +1,286 @@
+"""Approximate cache of LLM answers keyed by the meaning of the translated text."""
+import re
+import time
+import zlib
+import random
+import logging
+import importlib
+from threading import Lock
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+|[+\-*/=<>%]")
+
+# Function words dropped before embedding so paraphrases share most features
+_STOPWORDS = frozenset(
+    "a an and are as at be but by can could did do does for had has have i if in is it "
+    "its me my of on or our please should so that the their them there these they this was "
+    "we were what will with would you your".split()
+)
+
+_NEGATIONS = frozenset("not no never without".split())
+
+# Words and operators whose neighbours carry meaning in order ("USD to EUR", "not safe", "2-3")
+_DIRECTIONAL = _NEGATIONS | frozenset(
+    "to from into onto than before after versus vs + - * / = < > %".split()
+)
+
+
+class HashedNGramEmbedder:
+    """
+    Embeds text as a signed, hashed bag of words, word pairs and character n-grams.
+
+    Function words are dropped and ordinary word pairs are unordered, so short
+    paraphrases such as "how do I reset my password" and "password reset how?"
+    map to nearly the same vector. Pairs around direction words, negations,
+    operators and numbers keep their order and negated words are marked, so
+    "100 USD to EUR" and "100 EUR to USD", or "safe" and "not safe", do not.
+    Runs on the CPU with no model download.
+    """
+
+    def __init__(self, dim: int = 512, ngram_range: Tuple[int, int] = (3, 4),
+                 word_weight: float = 2.0, pair_weight: float = 2.0,
+                 ordered_weight: float = 4.0):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.word_weight = word_weight
+        self.pair_weight = pair_weight
+        self.ordered_weight = ordered_weight
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        tokens = _TOKEN.findall(text.lower())
+        content = [token for token in tokens if token not in _STOPWORDS] or tokens
+        features = []
+        for token in content:
+            features.append((f"w:{token}", self.word_weight))
+            padded = f"<{token}>"
+            for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+                features.extend((padded[i:i + n], 1.0) for i in range(len(padded) - n + 1))
+        for first, second in zip(content, content[1:]):
+            if {first, second} & _DIRECTIONAL or (first.isdigit() and second.isdigit()):
+                features.append((f"o:{first} {second}", self.ordered_weight))
+                if first in _NEGATIONS:
+                    # A negated word must not match its plain form
+                    features.append((f"n:{second}", self.ordered_weight))
+            else:
+                features.append((f"p:{' '.join(sorted((first, second)))}", self.pair_weight))
+        return features
+
+    def __call__(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+        # crc32 rather than hash() so vectors are stable across processes
+        hashes = np.array([zlib.crc32(feature.encode("utf-8")) for feature, _ in features],
+                          dtype=np.uint64)
+        weights = np.array([weight for _, weight in features], dtype=np.float32)
+        signs = np.where((hashes >> np.uint64(31)) & np.uint64(1), -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, (hashes % np.uint64(self.dim)).astype(np.intp), signs * weights)
+        return _normalize(vector)
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+class _PromptIndex:
+    """Brute-force cosine index over normalized vectors, grown on demand up to a bound."""
+
+    def __init__(self, dim: int, max_entries: int):
+        self.max_entries = max_entries
+        self.vectors = np.zeros((min(64, max_entries), dim), dtype=np.float32)
+        self.last_used = np.zeros(len(self.vectors), dtype=np.float64)
+        self.answers: List[Optional[str]] = [None] * len(self.vectors)
+        self.size = 0
+
+    def search(self, vector: np.ndarray) -> Optional[Tuple[int, float]]:
+        """Return the row and similarity of the nearest entry."""
+        if not self.size:
+            return None
+        similarities = self.vectors[:self.size] @ vector
+        row = int(np.argmax(similarities))
+        return row, float(similarities[row])
+
+    def add(self, vector: np.ndarray, answer: str, now: float) -> bool:
+        """Store an entry, evicting the least recently used one if full. True on eviction."""
+        evicted = False
+        if self.size == len(self.vectors) and self.size < self.max_entries:
+            rows = min(self.size * 2, self.max_entries)
+            self.vectors = np.resize(self.vectors, (rows, self.vectors.shape[1]))
+            self.last_used = np.resize(self.last_used, rows)
+            self.answers.extend([None] * (rows - len(self.answers)))
+        if self.size < len(self.vectors):
+            row = self.size
+            self.size += 1
+        else:
+            row = int(np.argmin(self.last_used))
+            evicted = True
+        self.vectors[row] = vector
+        self.answers[row] = answer
+        self.last_used[row] = now
+        return evicted
+
+    def replace(self, row: int, previous: str, vector: np.ndarray, answer: str,
+                now: float) -> bool:
+        """Overwrite ``row`` if it still holds ``previous``. Returns True if replaced."""
+        if row >= self.size or self.answers[row] is not previous:
+            return False
+        self.vectors[row] = vector
+        self.answers[row] = answer
+        self.last_used[row] = now
+        return True
+
+
+class SemanticCache:
+    """Returns stored LLM answers for texts similar to ones already answered."""
+
+    def __init__(self, config: Dict, embedder: Optional[Callable[[str], np.ndarray]] = None):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            config: Semantic cache configuration dictionary
+            embedder: Callable mapping text to a vector (overrides the configured embedder)
+        """
+        logger.info("Initializing SemanticCache")
+        self.config = config
+        for key in ("dim", "max_entries", "max_prompts"):
+            if key in config and config[key] < 1:
+                raise ConfigurationError(
+                    f"semantic_cache {key} must be at least 1, got {config[key]}")
+        self.threshold = config.get("threshold", 0.9)
+        self.max_entries = config.get("max_entries", 2000)
+        self.max_prompts = config.get("max_prompts", 16)
+        self.verify_sample_rate = config.get("verify_sample_rate", 0.0)
+        self.answer_threshold = config.get("answer_threshold", 0.8)
+        self.embedder = embedder or self._load_embedder(config.get("embedder", "hashed"),
+                                                        config.get("dim", 512))
+        self._indexes: "OrderedDict[Hashable, _PromptIndex]" = OrderedDict()
+        self._stats: Counter = Counter()
+        self._lock = Lock()
+        logger.debug(f"SemanticCache configured with: {config}")
+
+    @staticmethod
+    def _load_embedder(name: str, dim: int) -> Callable[[str], np.ndarray]:
+        """
+        Build the configured embedder: ``hashed`` or a ``module:factory`` path.
+
+        Raises:
+            ConfigurationError: If the embedder cannot be loaded
+        """
+        if name == "hashed":
+            return HashedNGramEmbedder(dim=dim)
+        try:
+            module_name, _, factory = name.partition(":")
+            return getattr(importlib.import_module(module_name), factory)()
+        except Exception as e:
+            raise ConfigurationError(f"Cannot load embedder {name}: {str(e)}")
+
+    def get_or_compute(self, namespace: Hashable, text: str, compute: Callable[[], str]) -> str:
+        """
+        Return a stored answer for a similar text, or compute and store one.
+
+        A sample of hits (``verify_sample_rate``) is also computed fresh; when
+        the fresh answer differs from the stored one the hit is counted as a
+        false positive, the fresh answer is returned and it replaces the
+        stored entry.
+
+        Args:
+            namespace: Key separating unrelated answers (backend, model, system
+                prompt and response language)
+            text: Translated text sent to the LLM
+            compute: Callable producing the answer on a miss
+        """
+        vector = _normalize(np.asarray(self.embedder(text), dtype=np.float32))
+        match = self._lookup(namespace, vector)
+
+        if match is not None:
+            row, cached = match
+            if self.verify_sample_rate <= 0 or random.random() >= self.verify_sample_rate:
+                return cached
+            answer = compute()
+            if not self._verify(cached, answer) and answer:
+                self._replace(namespace, row, cached, vector, answer)
+            return answer
+
+        answer = compute()
+        if answer:
+            self._store(namespace, vector, answer)
+        return answer
+
+    def _lookup(self, namespace: Hashable, vector: np.ndarray) -> Optional[Tuple[int, str]]:
+        """Return the row and answer of the nearest stored text above the threshold."""
+        with self._lock:
+            self._stats["lookups"] += 1
+            index = self._indexes.get(namespace)
+            match = index.search(vector) if index is not None else None
+            if match is None or match[1] < self.threshold:
+                self._stats["misses"] += 1
+                return None
+            row, similarity = match
+            self._indexes.move_to_end(namespace)
+            index.last_used[row] = time.monotonic()
+            self._stats["hits"] += 1
+            answer = index.answers[row]
+        logger.debug("Semantic cache hit with similarity %.3f", similarity)
+        return row, answer
+
+    def _store(self, namespace: Hashable, vector: np.ndarray, answer: str) -> None:
+        with self._lock:
+            index = self._indexes.get(namespace)
+            if index is None:
+                index = _PromptIndex(len(vector), self.max_entries)
+                self._indexes[namespace] = index
+                while len(self._indexes) > self.max_prompts:
+                    _, dropped = self._indexes.popitem(last=False)
+                    self._stats["evictions"] += dropped.size
+            self._indexes.move_to_end(namespace)
+            if index.add(vector, answer, time.monotonic()):
+                self._stats["evictions"] += 1
+            self._stats["inserts"] += 1
+
+    def _replace(self, namespace: Hashable, row: int, previous: str, vector: np.ndarray,
+                 answer: str) -> None:
+        """Swap a stale answer for a fresh one, unless the row was reused meanwhile."""
+        with self._lock:
+            index = self._indexes.get(namespace)
+            if index is not None and index.replace(row, previous, vector, answer,
+                                                   time.monotonic()):
+                self._stats["replaced"] += 1
+
+    def _verify(self, cached: str, fresh: str) -> bool:
+        """Compare a stored answer with a fresh one. Returns False on a false positive."""
+        similarity = float(_normalize(np.asarray(self.embedder(cached), dtype=np.float32)) @
+                           _normalize(np.asarray(self.embedder(fresh), dtype=np.float32)))
+        with self._lock:
+            self._stats["verified"] += 1
+            if similarity < self.answer_threshold:
+                self._stats["false_positives"] += 1
+        if similarity < self.answer_threshold:
+            logger.warning("Semantic cache false positive (answer similarity %.3f)", similarity)
+            return False
+        return True
+
+    def stats(self) -> Dict:
+        """Return hit, miss, eviction and false-positive counts and the cache size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = sum(index.size for index in self._indexes.values())
+            stats["prompts"] = len(self._indexes)
+        lookups = stats.get("lookups", 0)
+        verified = stats.get("verified", 0)
+        stats["hit_rate"] = stats.get("hits", 0) / lookups if lookups else 0.0
+        stats["false_positive_rate"] = (stats.get("false_positives", 0) / verified
+                                        if verified else 0.0)
+        return stats
+
+    def clear(self) -> None:
+        """Drop every stored answer."""
+        with self._lock:
+            self._indexes.clear()
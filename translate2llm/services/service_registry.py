@@ -0,0 +1,264 @@
+"""Registry of pooled translation and LLM services keyed by configuration."""
+import time
+import logging
+from threading import Lock
+from contextlib import contextmanager
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterator, Optional, Tuple
+from .exceptions import ConfigurationError
+from .translation_service import TranslationService
+from .llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+def _config_key(config: Dict) -> Tuple:
+    """Build a hashable key from a flat configuration dictionary."""
+    return tuple(sorted(config.items()))
+
+
+class _LRUPool:
+    """
+    Thread-safe LRU pool that lazily builds and evicts idle instances.
+
+    Instances are leased by ``acquire`` and returned by ``release``; an
+    instance evicted while leased is closed when its last lease is released.
+    Idle instances are swept on every acquire and release, including
+    acquires of pinned instances.
+    """
+
+    def __init__(self, name: str, factory: Callable[[Dict], object],
+                 max_size: int, idle_timeout: float):
+        self.name = name
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._items: "OrderedDict[Hashable, Tuple[object, float]]" = OrderedDict()
+        self._pinned: Dict[Hashable, object] = {}
+        self._leases: Dict[int, int] = {}
+        self._retired: Dict[int, object] = {}
+        self._lock = Lock()
+
+    def acquire(self, config: Dict):
+        """Lease the pooled instance for ``config``, creating it if needed."""
+        key = _config_key(config)
+        now = time.monotonic()
+        evicted = []
+        pinned = self._pinned.get(key)
+        if pinned is not None:
+            self.sweep()
+            return pinned
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                instance = entry[0]
+                self._items[key] = (instance, now)
+                self._items.move_to_end(key)
+            else:
+                logger.info(f"Creating pooled {self.name} instance")
+                instance = self.factory(dict(config))
+                self._items[key] = (instance, now)
+            self._leases[id(instance)] = self._leases.get(id(instance), 0) + 1
+            evicted = self._collect_evictions(now, keep=key)
+        for old in evicted:
+            _close(old)
+        return instance
+
+    def release(self, instance) -> None:
+        """Return a lease taken by ``acquire``, closing the instance if it was evicted."""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            leases = self._leases.get(id(instance))
+            if leases is None:
+                return
+            if leases > 1:
+                self._leases[id(instance)] = leases - 1
+            else:
+                del self._leases[id(instance)]
+                retired = self._retired.pop(id(instance), None)
+                if retired is not None:
+                    evicted.append(retired)
+            # Idle time counts from the end of the last use
+            for key, (item, _) in self._items.items():
+                if item is instance:
+                    self._items[key] = (instance, now)
+                    break
+            evicted.extend(self._collect_evictions(now))
+        for old in evicted:
+            _close(old)
+
+    def sweep(self) -> None:
+        """Close instances unused for longer than ``idle_timeout``."""
+        if self.idle_timeout <= 0 or not self._items:
+            return
+        with self._lock:
+            evicted = self._collect_evictions(time.monotonic())
+        for old in evicted:
+            _close(old)
+
+    def _collect_evictions(self, now: float, keep: Optional[Hashable] = None) -> list:
+        """
+        Pop idle and over-capacity entries and return those safe to close.
+
+        ``keep`` is never evicted for idleness; leased entries are kept aside
+        until released. Caller must hold the lock.
+        """
+        evicted = []
+        if self.idle_timeout > 0:
+            for key in list(self._items.keys()):
+                if key != keep and now - self._items[key][1] > self.idle_timeout:
+                    evicted.append(self._items.pop(key)[0])
+        while len(self._items) > self.max_size:
+            _, (instance, _) = self._items.popitem(last=False)
+            evicted.append(instance)
+        if evicted:
+            logger.debug(f"Evicting {len(evicted)} idle {self.name} instance(s)")
+        closable = []
+        for instance in evicted:
+            if id(instance) in self._leases:
+                self._retired[id(instance)] = instance
+            else:
+                closable.append(instance)
+        return closable
+
+    def pin(self, config: Dict, instance) -> None:
+        """Register an already constructed instance that is never evicted."""
+        with self._lock:
+            self._pinned[_config_key(config)] = instance
+
+    def clear(self) -> None:
+        """Close and drop every pooled instance, leaving pinned ones to their owner."""
+        with self._lock:
+            items = [instance for instance, _ in self._items.values()]
+            items.extend(self._retired.values())
+            self._items.clear()
+            self._retired.clear()
+            self._leases.clear()
+        for instance in items:
+            _close(instance)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items) + len(self._pinned)
+
+
+def _close(instance) -> None:
+    close = getattr(instance, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled service: {str(e)}")
+
+
+class ServiceRegistry:
+    """Lazily creates and reuses services per configuration profile."""
+
+    def __init__(self, config, max_services: Optional[int] = None,
+                 idle_timeout: Optional[float] = None):
+        """
+        Initialize the service registry.
+
+        Args:
+            config: Application ``Config`` used to resolve profiles
+            max_services: Maximum number of pooled instances per service type
+            idle_timeout: Seconds after which an unused instance is evicted
+        """
+        registry_config = config.get_registry_config()
+        max_services = max_services or registry_config["max_services"]
+        if idle_timeout is None:
+            idle_timeout = registry_config["idle_timeout"]
+
+        self.config = config
+        self.allowed_models = set(registry_config["allowed_models"])
+        self.allowed_models.update(config.get_llm_config(profile)["model"]
+                                   for profile in [None] + config.get_profiles())
+        self._translation_pool = _LRUPool(
+            "TranslationService", TranslationService, max_services, idle_timeout
+        )
+        self._llm_pool = _LRUPool("LLMService", LLMService, max_services, idle_timeout)
+        logger.debug(f"ServiceRegistry configured with max_services={max_services}, "
+                     f"idle_timeout={idle_timeout}")
+
+    def register(self, translation_config: Dict, translation_service: TranslationService,
+                 llm_config: Dict, llm_service: LLMService) -> None:
+        """Seed the pools with already constructed services that are never evicted."""
+        self._translation_pool.pin(translation_config, translation_service)
+        self._llm_pool.pin(llm_config, llm_service)
+
+    def resolve(self, profile: Optional[str] = None,
+                model: Optional[str] = None) -> Tuple[Dict, Dict]:
+        """
+        Resolve the translation and LLM configuration for a request.
+
+        Args:
+            profile: Name of a ``[profile.<name>]`` section in the config file
+            model: Optional model name overriding the profile's model
+
+        Returns:
+            Tuple of (translation_config, llm_config)
+
+        Raises:
+            ConfigurationError: If the profile is not defined or the model is not allowed
+        """
+        if model and model not in self.allowed_models:
+            raise ConfigurationError(f"Model not allowed: {model}")
+        translation_config = self.config.get_translation_config(profile)
+        llm_config = self.config.get_llm_config(profile)
+        if model:
+            llm_config["model"] = model
+        return translation_config, llm_config
+
+    def acquire(self, profile: Optional[str] = None,
+                model: Optional[str] = None) -> Tuple[TranslationService, LLMService]:
+        """
+        Lease pooled services for the given profile and model.
+
+        The services must be handed back with ``release`` (or use ``lease``).
+
+        Args:
+            profile: Name of a configuration profile (default profile if None)
+            model: Optional model name overriding the profile's model
+
+        Returns:
+            Tuple of (TranslationService, LLMService)
+
+        Raises:
+            ConfigurationError: If the profile is not defined or the model is not allowed
+        """
+        translation_config, llm_config = self.resolve(profile, model)
+        translation_service = self._translation_pool.acquire(translation_config)
+        try:
+            return translation_service, self._llm_pool.acquire(llm_config)
+        except BaseException:
+            self._translation_pool.release(translation_service)
+            raise
+
+    def release(self, services: Tuple[TranslationService, LLMService]) -> None:
+        """Return services leased by ``acquire``."""
+        translation_service, llm_service = services
+        self._translation_pool.release(translation_service)
+        self._llm_pool.release(llm_service)
+
+    @contextmanager
+    def lease(self, profile: Optional[str] = None,
+              model: Optional[str] = None) -> Iterator[Tuple[TranslationService, LLMService]]:
+        """Lease pooled services (see ``acquire``) for the duration of a ``with`` block."""
+        services = self.acquire(profile, model)
+        try:
+            yield services
+        finally:
+            self.release(services)
+
+    def stats(self) -> Dict:
+        """Return the number of pooled instances per service type."""
+        return {
+            "translation_services": len(self._translation_pool),
+            "llm_services": len(self._llm_pool),
+        }
+
+    def close(self) -> None:
+        """Close every pooled service."""
+        self._translation_pool.clear()
+        self._llm_pool.clear()
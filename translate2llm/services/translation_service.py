@@ -2,11 +2,13 @@
 import logging
 import asyncio
 import inspect
-from threading import Thread
-from typing import Optional, Dict
+import concurrent.futures
+from threading import Lock, Thread
+from typing import Optional, Dict, Set
 from functools import lru_cache
 from googletrans import Translator, LANGUAGES
-from .exceptions import TranslationError
+from .exceptions import TranslationError, RequestCancelledError
+from .deadline import current_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,12 @@ class TranslationService:
         self.use_cache = self.config.get("use_cache", True)
         self.source_lang = self.config.get("source_lang", "auto")
         self.target_lang = self.config.get("target_lang", "en")
+        # Cache per instance so a shared cache does not keep closed services alive
+        self._cached_translate = lru_cache(maxsize=1000)(self._translate_text)
+        # Calls awaiting the loop, failed on close so their callers do not hang
+        self._pending: Set[concurrent.futures.Future] = set()
+        self._pending_lock = Lock()
+        self._closed = False
         # Create a dedicated background event loop to run any awaited operations
         self._loop = asyncio.new_event_loop()
         self._loop_thread = Thread(target=self._run_event_loop, daemon=True)
@@ -37,12 +45,42 @@ class TranslationService:
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
+    def close(self) -> None:
+        """Fail pending calls and stop the background event loop used for awaited operations."""
+        with self._pending_lock:
+            self._closed = True
+            pending, self._pending = self._pending, set()
+        for future in pending:
+            future.cancel()
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=self.config.get("timeout", 5))
+        if not self._loop.is_running():
+            self._loop.close()
+        logger.debug("TranslationService closed")
+
     def _resolve_maybe_awaitable(self, value):
         """Resolve value that might be an awaitable to its result synchronously."""
-        if inspect.isawaitable(value):
+        if not inspect.isawaitable(value):
+            return value
+        with self._pending_lock:
+            if self._closed:
+                if inspect.iscoroutine(value):
+                    value.close()
+                raise TranslationError("TranslationService is closed")
             future = asyncio.run_coroutine_threadsafe(value, self._loop)
+            self._pending.add(future)
+        try:
+            deadline = current_deadline()
+            if deadline is not None:
+                return deadline.wait(future)
             return future.result()
-        return value
+        except concurrent.futures.CancelledError:
+            raise TranslationError("TranslationService was closed during the call")
+        finally:
+            with self._pending_lock:
+                self._pending.discard(future)
 
     def validate_language(self, lang_code: str) -> bool:
         """
@@ -56,10 +94,9 @@ class TranslationService:
         """
         return lang_code in LANGUAGES
 
-    @lru_cache(maxsize=1000)
-    def _cached_translate(self, text: str, target_lang: str, source_lang: str = "auto") -> str:
+    def _translate_text(self, text: str, target_lang: str, source_lang: str = "auto") -> str:
         """
-        Cached version of the translation function.
+        Translate text with explicit language codes (cached per instance as ``_cached_translate``).
         
         Args:
             text: Text to translate
@@ -79,10 +116,12 @@ class TranslationService:
                 src=source_lang
             )
             result = self._resolve_maybe_awaitable(result)
-            logger.debug(f"Translated text from {source_lang} to {target_lang}")
+            logger.debug("Translated text from %s to %s", source_lang, target_lang)
             return getattr(result, "text", str(result))
+        except RequestCancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Translation error: {str(e)}")
+            logger.error("Translation error: %s", e)
             raise TranslationError(f"Translation failed: {str(e)}")
 
     def translate(self, text: str, target_lang: Optional[str] = None, 
@@ -111,26 +150,18 @@ class TranslationService:
 
         # Validate language codes
         if target != "auto" and not self.validate_language(target):
-            logger.error(f"Invalid target language code: {target}")
+            logger.error("Invalid target language code: %s", target)
             raise ValueError(f"Invalid target language code: {target}")
 
         if source != "auto" and not self.validate_language(source):
-            logger.error(f"Invalid source language code: {source}")
+            logger.error("Invalid source language code: %s", source)
             raise ValueError(f"Invalid source language code: {source}")
 
-        logger.info(f"Translating text from {source} to {target}")
+        logger.debug("Translating text from %s to %s", source, target)
         
         if self.use_cache:
             return self._cached_translate(text, target, source)
-        
-        try:
-            result = self.translator.translate(text, dest=target, src=source)
-            result = self._resolve_maybe_awaitable(result)
-            logger.debug(f"Translated text from {source} to {target}")
-            return getattr(result, "text", str(result))
-        except Exception as e:
-            logger.error(f"Translation error: {str(e)}")
-            raise TranslationError(f"Translation failed: {str(e)}")
+        return self._translate_text(text, target, source)
 
     def detect_language(self, text: str) -> str:
         """
@@ -152,8 +183,10 @@ class TranslationService:
         try:
             detection = self.translator.detect(text)
             detection = self._resolve_maybe_awaitable(detection)
-            logger.debug(f"Detected language: {str(detection)}")
+            logger.debug("Detected language: %s", detection)
             return getattr(detection, "lang", str(detection))
+        except RequestCancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Language detection error: {str(e)}")
+            logger.error("Language detection error: %s", e)
             raise TranslationError(f"Language detection failed: {str(e)}")
\ No newline at end of file
@@ -1,10 +1,20 @@
 """Main application class for text translation and LLM processing."""
+import time
 import logging
-from typing import Dict, Optional
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Tuple
 from .config.config_manager import Config
 from .services.translation_service import TranslationService
 from .services.llm_service import LLMService
-from .services.exceptions import TranslationError, LLMError
+from .services.service_registry import ServiceRegistry
+from .services.back_translation import BackTranslator
+from .services.semantic_cache import SemanticCache
+from .services.deadline import Deadline, deadline_scope
+from .services.exceptions import (TranslationError, LLMError, RequestCancelledError,
+                                  DeadlineExceededError, ConfigurationError)
+from .metrics import metrics
+from .profiling import profiler
 
 logger = logging.getLogger(__name__)
 
@@ -24,15 +34,40 @@ class TranslateLLM:
         self.config = Config(config_path)
         self.config.setup_logging()
         
-        # Initialize services
-        self.translation_service = TranslationService(self.config.get_translation_config())
-        self.llm_service = LLMService(self.config.get_llm_config())
+        # Initialize default services and the pool for per-request profiles
+        translation_config = self.config.get_translation_config()
+        llm_config = self.config.get_llm_config()
+        self.translation_service = TranslationService(translation_config)
+        self.llm_service = LLMService(llm_config)
+        self.registry = ServiceRegistry(self.config)
+        self.registry.register(translation_config, self.translation_service,
+                               llm_config, self.llm_service)
+        self.deadline_config = self.config.get_deadline_config()
+        semantic_cache_config = self.config.get_semantic_cache_config()
+        self.semantic_cache = (SemanticCache(semantic_cache_config)
+                               if semantic_cache_config["enabled"] else None)
+        # One pool for every request; back_translation_workers bounds sentences in flight overall
+        self._back_translation_executor = ThreadPoolExecutor(
+            max_workers=translation_config["back_translation_workers"],
+            thread_name_prefix="back-translation"
+        )
+        self.profiling_config = self.config.get_profiling_config()
+        self.logging_config = self.config.get_logging_config()
+        # Per-stage lines are demoted when a one-line request summary is logged instead
+        self._stage_log_level = (logging.DEBUG if self.logging_config["request_summary"]
+                                 else logging.INFO)
+        profiler.configure(sample_rate=self.profiling_config["sample_rate"],
+                           interval=self.profiling_config["interval"])
         
         logger.debug("TranslateLLM service initialized successfully")
 
     def process(self, text: str, target_lang: Optional[str] = None, 
                 source_lang: Optional[str] = None,
-                system_prompt: Optional[str] = None) -> Dict:
+                system_prompt: Optional[str] = None,
+                profile: Optional[str] = None,
+                model: Optional[str] = None,
+                deadline: Optional[Deadline] = None,
+                return_in_source_language: bool = False) -> Dict:
         """
         Process text through translation and LLM.
         
@@ -41,6 +76,11 @@ class TranslateLLM:
             target_lang: Target language for translation
             source_lang: Source language of input text
             system_prompt: Optional system prompt for LLM
+            profile: Optional configuration profile to process with
+            model: Optional LLM model overriding the profile's model
+            deadline: Optional deadline; defaults to [deadline] default_timeout
+            return_in_source_language: Also translate the LLM response back into
+                the source language, sentence by sentence while it streams
         
         Returns:
             Dict containing:
@@ -48,57 +88,229 @@ class TranslateLLM:
                 - detected_language: Detected source language
                 - translated_text: Translated text
                 - llm_response: LLM response to translated text
+                - target_language: Language the text was translated to
+                - translated_response: LLM response in the source language
+                  (None unless return_in_source_language is set)
+                - timings: Seconds spent in each stage that ran
                 
         Raises:
             TranslationError: If translation fails
             LLMError: If LLM processing fails
+            ConfigurationError: If the profile is not defined
+            DeadlineExceededError: If the deadline passes or leaves too little budget
+            RequestCancelledError: If the request is cancelled
         """
         if not text or not text.strip():
             logger.warning("Empty text provided")
+            default_lang = (self.config.get_translation_config(profile)["target_lang"]
+                            if profile else self.translation_service.target_lang)
             return {
                 "original_text": text,
                 "detected_language": None,
                 "translated_text": text,
-                "llm_response": ""
+                "llm_response": "",
+                "target_language": target_lang or default_lang,
+                "translated_response": "" if return_in_source_language else None,
+                "timings": {}
             }
 
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        result = None
+        status = "ok"
+
         try:
-            # Detect language if not specified
-            detected_lang = (source_lang or 
-                           self.translation_service.detect_language(text))
-            logger.info(f"Detected language: {detected_lang}")
-
-            # Translate if needed
-            translated_text = text
-            if ((target_lang and detected_lang != target_lang) or 
-                (not target_lang and detected_lang != self.translation_service.target_lang)):
-                translated_text = self.translation_service.translate(
-                    text,
-                    target_lang=target_lang,
-                    source_lang=detected_lang
-                )
-                logger.info("Text translated successfully")
-
-            # Process with LLM
-            llm_response = self.llm_service.process_text(
-                translated_text,
-                system_prompt
-            )
-            logger.info("LLM processing completed")
+            if deadline is None and self.deadline_config["default_timeout"] > 0:
+                deadline = Deadline(self.deadline_config["default_timeout"])
 
-            return {
-                "original_text": text,
-                "detected_language": detected_lang,
-                "translated_text": translated_text,
-                "llm_response": llm_response
-            }
+            with self._services(profile, model) as (translation_service, llm_service), \
+                    deadline_scope(deadline), profiler.request_scope():
+                result = self._process(text, target_lang, source_lang, system_prompt,
+                                       translation_service, llm_service, deadline, timings,
+                                       return_in_source_language)
+                return result
 
         except TranslationError as e:
-            logger.error(f"Translation error: {str(e)}")
+            status = "translation_error"
+            logger.error("Translation error: %s", e)
             raise
         except LLMError as e:
-            logger.error(f"LLM error: {str(e)}")
+            status = "llm_error"
+            logger.error("LLM error: %s", e)
+            raise
+        except RequestCancelledError as e:
+            reason = "deadline" if isinstance(e, DeadlineExceededError) else deadline.reason
+            status = f"cancelled_{reason}"
+            metrics.increment("requests_cancelled")
+            metrics.increment(f"requests_cancelled.{reason}")
+            logger.warning("Request cancelled: %s", e)
+            raise
+        except ConfigurationError as e:
+            status = "configuration_error"
+            logger.error("Configuration error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise
\ No newline at end of file
+            status = "error"
+            logger.error("Unexpected error: %s", e)
+            raise
+        finally:
+            if self.logging_config["request_summary"]:
+                self._log_summary(status, text, target_lang, profile, model, result,
+                                  timings, time.perf_counter() - started)
+
+    def _log_summary(self, status: str, text: str, target_lang: Optional[str],
+                     profile: Optional[str], model: Optional[str], result: Optional[Dict],
+                     timings: Dict[str, float], total: float) -> None:
+        """Log one structured line describing a processed request."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        fields = [
+            f"status={status}",
+            f"source={result['detected_language'] if result else '-'}",
+            f"target={target_lang or '-'}",
+            f"chars={len(text)}",
+        ]
+        if profile:
+            fields.append(f"profile={profile}")
+        if model:
+            fields.append(f"model={model}")
+        fields.extend(f"{stage}_ms={seconds * 1000:.1f}" for stage, seconds in timings.items())
+        fields.append(f"total_ms={total * 1000:.1f}")
+        logger.info("request %s", " ".join(fields))
+
+    def _process(self, text: str, target_lang: Optional[str], source_lang: Optional[str],
+                 system_prompt: Optional[str], translation_service: TranslationService,
+                 llm_service: LLMService, deadline: Optional[Deadline],
+                 timings: Dict[str, float], return_in_source_language: bool) -> Dict:
+        """Run detection, translation and LLM stages, checking the deadline before each."""
+
+        # Detect language if not specified
+        detected_lang = source_lang
+        if not detected_lang:
+            self._check_stage(deadline, "detection")
+            started = time.perf_counter()
+            detected_lang = translation_service.detect_language(text)
+            timings["detection"] = time.perf_counter() - started
+        logger.log(self._stage_log_level, "Detected language: %s", detected_lang)
+
+        # Translate if needed
+        translated_text = text
+        needs_translation = ((target_lang and detected_lang != target_lang) or
+                             (not target_lang and detected_lang != translation_service.target_lang))
+        if needs_translation:
+            self._check_stage(deadline, "translation")
+            started = time.perf_counter()
+            translated_text = translation_service.translate(
+                text,
+                target_lang=target_lang,
+                source_lang=detected_lang
+            )
+            timings["translation"] = time.perf_counter() - started
+            logger.log(self._stage_log_level, "Text translated successfully")
+
+        # Process with LLM
+        self._check_stage(deadline, "llm")
+        response_lang = target_lang or translation_service.target_lang
+        translated_response = None
+        if return_in_source_language and needs_translation:
+            llm_response, translated_response = self._process_with_back_translation(
+                translated_text, system_prompt, translation_service, llm_service,
+                response_lang=response_lang,
+                source_lang=detected_lang, deadline=deadline, timings=timings
+            )
+        else:
+            started = time.perf_counter()
+            llm_response = self._cached_llm_call(
+                llm_service, translated_text, system_prompt, response_lang,
+                lambda: llm_service.process_text(translated_text, system_prompt)
+            )
+            timings["llm"] = time.perf_counter() - started
+            if return_in_source_language:
+                translated_response = llm_response
+        logger.log(self._stage_log_level, "LLM processing completed")
+
+        return {
+            "original_text": text,
+            "detected_language": detected_lang,
+            "translated_text": translated_text,
+            "llm_response": llm_response,
+            "target_language": response_lang,
+            "translated_response": translated_response,
+            "timings": timings
+        }
+
+    def _process_with_back_translation(self, text: str, system_prompt: Optional[str],
+                                       translation_service: TranslationService,
+                                       llm_service: LLMService, response_lang: str,
+                                       source_lang: str, deadline: Optional[Deadline],
+                                       timings: Dict[str, float]) -> Tuple[str, str]:
+        """
+        Stream the LLM response while translating each completed sentence back.
+
+        Returns:
+            Tuple of (LLM response, LLM response in the source language)
+        """
+        back_translator = BackTranslator(translation_service, self._back_translation_executor,
+                                         source_lang=response_lang, target_lang=source_lang)
+        chunks = []
+
+        def generate() -> str:
+            for chunk in llm_service.stream_text(text, system_prompt):
+                chunks.append(chunk)
+                back_translator.feed(chunk)
+            return "".join(chunks)
+
+        started = time.perf_counter()
+        try:
+            llm_response = self._cached_llm_call(llm_service, text, system_prompt,
+                                                 response_lang, generate)
+            if not chunks:
+                # Served from the semantic cache: translate the stored answer in one go
+                back_translator.feed(llm_response)
+            timings["llm"] = time.perf_counter() - started
+
+            # Only the sentences still in flight remain once generation ends
+            self._check_stage(deadline, "back_translation")
+            started = time.perf_counter()
+            translated_response = back_translator.result()
+            timings["back_translation"] = time.perf_counter() - started
+        except BaseException:
+            back_translator.cancel()
+            raise
+        return llm_response, translated_response
+
+    def _cached_llm_call(self, llm_service: LLMService, text: str,
+                         system_prompt: Optional[str], response_lang: str,
+                         compute: Callable[[], str]) -> str:
+        """Answer through the semantic cache when enabled, one index per LLM setup and language."""
+        if self.semantic_cache is None:
+            return compute()
+        config = llm_service.config
+        namespace = (config.get("model_provider"), config.get("base_url"), config.get("model"),
+                     config.get("temperature"), system_prompt or "", response_lang)
+        return self.semantic_cache.get_or_compute(namespace, text, compute)
+
+    def _check_stage(self, deadline: Optional[Deadline], stage: str) -> None:
+        """Skip ``stage`` by raising if the deadline leaves too little budget for it."""
+        if deadline is None:
+            return
+        try:
+            deadline.check(stage, self.deadline_config["min_budgets"][stage])
+        except DeadlineExceededError:
+            metrics.increment(f"stages_skipped.{stage}")
+            raise
+
+    @contextmanager
+    def _services(self, profile: Optional[str] = None,
+                  model: Optional[str] = None) -> Iterator[Tuple[TranslationService, LLMService]]:
+        """Lease the services to use for a request, pooled per profile and model."""
+        if not profile and not model:
+            yield self.translation_service, self.llm_service
+            return
+        with self.registry.lease(profile, model) as services:
+            yield services
+
+    def close(self) -> None:
+        """Release all pooled services."""
+        self._back_translation_executor.shutdown(wait=False)
+        self.registry.close()